@@ -0,0 +1,15 @@
+"""
+Shared API dependencies.
+
+Handlers receive the application's composition root through a single
+dependency. It is declared ``async`` so FastAPI resolves it on the event
+loop instead of dispatching it to the threadpool on every request.
+"""
+from fastapi import Request
+
+from app.core.container import Container
+
+
+async def get_container(request: Request) -> Container:
+    """Dependency that provides the container built by create_app."""
+    return request.app.state.container
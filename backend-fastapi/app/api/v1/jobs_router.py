@@ -0,0 +1,126 @@
+"""
+Jobs API Router - Interface/API layer.
+
+Endpoints for submitting long-running bulk operations, polling their
+progress and cancelling them. The work runs on the job runner's own
+worker threads, not on the request threadpool.
+"""
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status, Depends
+
+from app.api.dependencies import get_container
+from app.application.jobs.job import Job
+from app.core.container import Container
+from app.domain.exceptions import (
+    JobAlreadyFinishedException,
+    JobNotFoundException,
+    JobQueueFullException,
+)
+from app.infrastructure.jobs.job_runner import JobRunner
+from app.schemas.job_schemas import BulkCreateJobRequest, BulkDeleteJobRequest, JobResponse
+
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
+
+
+def _job_to_response(job: Job) -> JobResponse:
+    """Helper to convert a job to response DTO."""
+    return JobResponse.model_validate(job)
+
+
+def _submit(runner: JobRunner, kind: str, total: int, work) -> JobResponse:
+    """Submit a job, mapping a full queue to 503."""
+    try:
+        return _job_to_response(runner.submit(kind, total, work))
+    except JobQueueFullException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        )
+
+
+@router.post("/bulk-delete", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_bulk_delete(
+    request: BulkDeleteJobRequest,
+    container: Container = Depends(get_container),
+):
+    """
+    Submit a job that deletes many projects.
+    
+    Unknown project IDs are reported as item failures on the job.
+    
+    Raises:
+        503: If the job queue is full.
+    """
+    use_case = container.bulk_delete_projects
+    project_ids = request.project_ids
+    return _submit(
+        container.job_runner,
+        "bulk_delete",
+        len(project_ids),
+        lambda job: use_case.execute(project_ids, job),
+    )
+
+
+@router.post("/bulk-create", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_bulk_create(
+    request: BulkCreateJobRequest,
+    container: Container = Depends(get_container),
+):
+    """
+    Submit a job that imports many projects.
+    
+    Raises:
+        503: If the job queue is full.
+    """
+    use_case = container.bulk_create_projects
+    projects = [p.model_dump() for p in request.projects]
+    return _submit(
+        container.job_runner,
+        "bulk_create",
+        len(projects),
+        lambda job: use_case.execute(projects, job),
+    )
+
+
+@router.get("/{job_id}", response_model=JobResponse, status_code=status.HTTP_200_OK)
+def get_job(job_id: UUID, container: Container = Depends(get_container)):
+    """
+    Get the status and progress of a job.
+    
+    Raises:
+        404: If the job is not found.
+    """
+    try:
+        return _job_to_response(container.job_runner.get(job_id))
+    except JobNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def cancel_job(job_id: UUID, container: Container = Depends(get_container)):
+    """
+    Request cancellation of a job.
+    
+    Queued jobs never start; running jobs stop after their current batch.
+    
+    Raises:
+        404: If the job is not found.
+        409: If the job has already finished.
+    """
+    try:
+        return _job_to_response(container.job_runner.cancel(job_id))
+    except JobNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except JobAlreadyFinishedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
@@ -3,90 +3,216 @@ Projects API Router - Interface/API layer.
 
 This module contains HTTP endpoints for project operations.
 Controllers are kept thin - they handle HTTP concerns and delegate
-business logic to use cases.
+business logic to use cases, which are built once by the composition
+root (app.core.container) and reached through get_container.
 """
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Set
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Header, Query, Response, status, Depends
 
-from app.domain.entities import Project
-from app.domain.exceptions import ProjectNotFoundException
+from app.api.dependencies import get_container
+from app.core.container import Container
+from app.domain.entities import Project, ProjectRevision, TaskRollup
+from app.domain.exceptions import (
+    ProjectNotFoundException,
+    ProjectVersionConflictException,
+    WorkspaceQuotaExceededException,
+)
 from app.schemas.project_schemas import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
     ProjectResponse,
+    ProjectListItemResponse,
+    ProjectBatchGetRequest,
+    ProjectBatchGetResponse,
+    ProjectRevisionResponse,
+    WORKSPACE_ID_PATTERN,
 )
-from app.application.use_cases.list_projects import ListProjectsUseCase
-from app.application.use_cases.get_project import GetProjectUseCase
-from app.application.use_cases.create_project import CreateProjectUseCase
-from app.application.use_cases.update_project import UpdateProjectUseCase
-from app.application.use_cases.delete_project import DeleteProjectUseCase
-from app.infrastructure.repositories.project_repository import (
-    ProjectRepository,
-    InMemoryProjectRepository,
-)
+from app.schemas.task_schemas import TaskRollupResponse
 
 
 router = APIRouter(prefix="/api/v1/projects", tags=["projects"])
 
 
-# Dependency injection - provides repository to endpoints
-# In a real application, this would use a proper DI container
-def get_repository() -> ProjectRepository:
-    """
-    Dependency that provides the project repository.
-    
-    In production, this would be configured to return the appropriate
-    repository implementation (e.g., database-backed).
-    """
-    # For now, we use a singleton pattern for the in-memory repository
-    if not hasattr(get_repository, "_instance"):
-        get_repository._instance = InMemoryProjectRepository()
-    return get_repository._instance
-
-
 def _project_to_response(project: Project) -> ProjectResponse:
     """Helper to convert domain entity to response DTO."""
     return ProjectResponse(
         id=project.id,
+        workspace_id=project.workspace_id,
+        name=project.name,
+        description=project.description,
+        status=project.status,
+        created_at=project.created_at,
+    )
+
+
+def _project_to_list_item(
+    project: Project, rollup: Optional[TaskRollup] = None
+) -> ProjectListItemResponse:
+    """Helper to convert domain entity to a listing DTO, with an optional rollup."""
+    return ProjectListItemResponse(
+        id=project.id,
+        workspace_id=project.workspace_id,
         name=project.name,
         description=project.description,
         status=project.status,
         created_at=project.created_at,
+        task_rollup=_rollup_to_response(rollup) if rollup is not None else None,
     )
 
 
-@router.get("", response_model=List[ProjectResponse], status_code=status.HTTP_200_OK)
-def list_projects(repository: ProjectRepository = Depends(get_repository)):
+def _rollup_to_response(rollup: TaskRollup) -> TaskRollupResponse:
+    """Helper to convert a task rollup to response DTO."""
+    return TaskRollupResponse(
+        total=rollup.total,
+        done=rollup.done,
+        percent_complete=rollup.percent_complete,
+    )
+
+
+def _revision_to_response(revision: ProjectRevision) -> ProjectRevisionResponse:
+    """Helper to convert a revision to response DTO."""
+    return ProjectRevisionResponse(
+        revision=revision.number,
+        version=revision.version,
+        changed_at=revision.changed_at,
+        changes=revision.changes,
+        checkpoint=revision.is_checkpoint,
+    )
+
+
+def _etag(project: Project) -> str:
+    """Strong entity tag for a project's current version."""
+    return f'"{project.version}"'
+
+
+def _parse_if_match(if_match: Optional[str]) -> Optional[Set[int]]:
+    """
+    Turn an If-Match header into the versions the client accepts.
+    
+    If-Match is a comma-separated list of entity tags, compared strongly:
+    weak tags and tags this API never produced cannot match, so they are
+    ignored (a header with no usable tag therefore always fails). Returns
+    None when any version is acceptable (no header, or ``*``).
+    """
+    if if_match is None:
+        return None
+    
+    versions = set()
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return None
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.add(int(tag[1:-1]))
+    return versions
+
+
+@router.get(
+    "",
+    response_model=List[ProjectListItemResponse],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+def list_projects(
+    created_after: Optional[datetime] = Query(
+        None, description="Only include projects created at or after this timestamp"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Only include projects created before this timestamp"
+    ),
+    workspace_id: Optional[str] = Query(
+        None,
+        pattern=WORKSPACE_ID_PATTERN,
+        description="Only include projects of this workspace",
+    ),
+    include_task_rollup: bool = Query(
+        False, description="Include task counts and percent complete for each project"
+    ),
+    container: Container = Depends(get_container),
+):
     """
     List all projects.
     
-    Returns projects sorted by creation date (newest first).
+    Returns projects sorted by creation date (newest first), optionally
+    restricted to a creation time window and to one workspace. Timestamps
+    without a timezone are interpreted as UTC. Task rollups, when requested, are loaded for
+    the whole list in one batched call.
+    
+    Raises:
+        400: If created_after is later than created_before.
+    """
+    try:
+        projects = container.list_projects.execute(
+            created_after=created_after,
+            created_before=created_before,
+            workspace_id=workspace_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    if not include_task_rollup:
+        return [_project_to_list_item(p) for p in projects]
+    
+    rollups = container.get_task_rollups.execute([p.id for p in projects])
+    return [_project_to_list_item(p, rollups[p.id]) for p in projects]
+
+
+@router.post(":batchGet", response_model=ProjectBatchGetResponse, status_code=status.HTTP_200_OK)
+def batch_get_projects(
+    request: ProjectBatchGetRequest,
+    container: Container = Depends(get_container),
+):
     """
-    use_case = ListProjectsUseCase(repository)
-    projects = use_case.execute()
-    return [_project_to_response(p) for p in projects]
+    Get several projects by ID in a single request.
+    
+    Args:
+        request: The project IDs to fetch (up to 500).
+        
+    Returns:
+        The projects that were found, plus the IDs that were not.
+    """
+    projects, missing_ids = container.get_projects_by_ids.execute(request.ids)
+    return ProjectBatchGetResponse(
+        projects=[_project_to_response(p) for p in projects],
+        missing_ids=missing_ids,
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectResponse, status_code=status.HTTP_200_OK)
-def get_project(project_id: UUID, repository: ProjectRepository = Depends(get_repository)):
+def get_project(
+    project_id: UUID,
+    response: Response,
+    as_of: Optional[datetime] = Query(
+        None, description="Return the project as it was at this timestamp"
+    ),
+    container: Container = Depends(get_container),
+):
     """
     Get a specific project by ID.
     
     Args:
         project_id: The UUID of the project.
+        as_of: Optional point in time to read the project at.
         
     Returns:
-        The project details.
+        The project details. Current reads carry an ETag header for
+        conditional updates; as_of reads do not.
         
     Raises:
-        404: If the project is not found.
+        404: If the project is not found (or did not exist at as_of).
     """
-    use_case = GetProjectUseCase(repository)
-    
     try:
-        project = use_case.execute(project_id)
+        if as_of is None:
+            project = container.get_project.execute(project_id)
+            response.headers["ETag"] = _etag(project)
+        else:
+            project = container.get_project_as_of.execute(project_id, as_of)
         return _project_to_response(project)
     except ProjectNotFoundException as e:
         raise HTTPException(
@@ -95,10 +221,39 @@ def get_project(project_id: UUID, repository: ProjectRepository = Depends(get_re
         )
 
 
+@router.get(
+    "/{project_id}/revisions",
+    response_model=List[ProjectRevisionResponse],
+    status_code=status.HTTP_200_OK,
+)
+def list_project_revisions(
+    project_id: UUID,
+    container: Container = Depends(get_container),
+):
+    """
+    List the recorded revisions of a project, oldest first.
+    
+    Revision 0 is the state before the first update; projects that were
+    never updated have no revisions.
+    
+    Raises:
+        404: If the project is not found.
+    """
+    try:
+        revisions = container.list_project_revisions.execute(project_id)
+    except ProjectNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    return [_revision_to_response(r) for r in revisions]
+
+
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 def create_project(
     request: ProjectCreateRequest,
-    repository: ProjectRepository = Depends(get_repository),
+    response: Response,
+    container: Container = Depends(get_container),
 ):
     """
     Create a new project.
@@ -107,76 +262,106 @@ def create_project(
         request: Project creation data.
         
     Returns:
-        The created project.
+        The created project, with its ETag header.
         
     Raises:
         400: If validation fails.
+        507: If the project's workspace is over its storage quota.
     """
-    use_case = CreateProjectUseCase(repository)
-    
     try:
-        project = use_case.execute(
+        project = container.create_project.execute(
             name=request.name,
             description=request.description,
             status=request.status,
+            workspace_id=request.workspace_id,
         )
+        response.headers["ETag"] = _etag(project)
         return _project_to_response(project)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except WorkspaceQuotaExceededException as e:
+        raise HTTPException(
+            status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+            detail=str(e),
+        )
 
 
 @router.put("/{project_id}", response_model=ProjectResponse, status_code=status.HTTP_200_OK)
 def update_project(
     project_id: UUID,
     request: ProjectUpdateRequest,
-    repository: ProjectRepository = Depends(get_repository),
+    response: Response,
+    if_match: Optional[str] = Header(
+        None, description="ETag of the version being updated, from a previous read"
+    ),
+    container: Container = Depends(get_container),
 ):
     """
     Update an existing project.
     
+    With an If-Match header the update only applies if the project is
+    still at one of the listed versions, so a client cannot overwrite changes it has
+    not seen.
+    
     Args:
         project_id: The UUID of the project to update.
         request: Update data (all fields optional).
+        if_match: Optional ETag the client last read.
         
     Returns:
-        The updated project.
+        The updated project, with its new ETag header.
         
     Raises:
         404: If the project is not found.
         400: If validation fails.
+        412: If the project is not at any version listed in If-Match, or
+            kept changing under concurrent updates until retries ran out.
+            Updates without If-Match never fail with 412.
+        507: If the project's workspace is over its storage quota.
     """
-    use_case = UpdateProjectUseCase(repository)
-    
+    expected_versions = _parse_if_match(if_match)
     try:
-        project = use_case.execute(
+        project = container.update_project.execute(
             project_id=project_id,
             name=request.name,
             description=request.description,
             status=request.status,
+            expected_versions=expected_versions,
         )
+        response.headers["ETag"] = _etag(project)
         return _project_to_response(project)
     except ProjectNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
+    except ProjectVersionConflictException as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(e),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except WorkspaceQuotaExceededException as e:
+        raise HTTPException(
+            status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+            detail=str(e),
+        )
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: UUID,
-    repository: ProjectRepository = Depends(get_repository),
+    container: Container = Depends(get_container),
 ):
     """
-    Delete a project.
+    Delete a project with its tasks and revision history.
     
     Args:
         project_id: The UUID of the project to delete.
@@ -184,10 +369,8 @@ def delete_project(
     Raises:
         404: If the project is not found.
     """
-    use_case = DeleteProjectUseCase(repository)
-    
     try:
-        use_case.execute(project_id)
+        container.delete_project.execute(project_id)
     except ProjectNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
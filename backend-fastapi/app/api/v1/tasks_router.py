@@ -0,0 +1,137 @@
+"""
+Tasks API Router - Interface/API layer.
+
+HTTP endpoints for the tasks of a project, nested under the project resource.
+"""
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status, Depends
+
+from app.domain.entities import Task
+from app.domain.exceptions import ProjectNotFoundException, TaskNotFoundException
+from app.schemas.task_schemas import TaskCreateRequest, TaskUpdateRequest, TaskResponse
+from app.api.dependencies import get_container
+from app.core.container import Container
+
+
+router = APIRouter(prefix="/api/v1/projects/{project_id}/tasks", tags=["tasks"])
+
+
+def _task_to_response(task: Task) -> TaskResponse:
+    """Helper to convert domain entity to response DTO."""
+    return TaskResponse(
+        id=task.id,
+        project_id=task.project_id,
+        title=task.title,
+        status=task.status,
+        created_at=task.created_at,
+    )
+
+
+@router.get("", response_model=List[TaskResponse], status_code=status.HTTP_200_OK)
+def list_tasks(
+    project_id: UUID,
+    container: Container = Depends(get_container),
+):
+    """
+    List the tasks of a project in creation order.
+    
+    Raises:
+        404: If the project is not found.
+    """
+    try:
+        tasks = container.list_tasks.execute(project_id)
+    except ProjectNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    return [_task_to_response(t) for t in tasks]
+
+
+@router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+def create_task(
+    project_id: UUID,
+    request: TaskCreateRequest,
+    container: Container = Depends(get_container),
+):
+    """
+    Create a task in a project.
+    
+    Raises:
+        404: If the project is not found.
+        400: If validation fails.
+    """
+    try:
+        task = container.create_task.execute(
+            project_id=project_id,
+            title=request.title,
+            status=request.status,
+        )
+        return _task_to_response(task)
+    except ProjectNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.put("/{task_id}", response_model=TaskResponse, status_code=status.HTTP_200_OK)
+def update_task(
+    project_id: UUID,
+    task_id: UUID,
+    request: TaskUpdateRequest,
+    container: Container = Depends(get_container),
+):
+    """
+    Update a task of a project.
+    
+    Raises:
+        404: If the task is not found in the project.
+        400: If validation fails.
+    """
+    try:
+        task = container.update_task.execute(
+            project_id=project_id,
+            task_id=task_id,
+            title=request.title,
+            status=request.status,
+        )
+        return _task_to_response(task)
+    except TaskNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_task(
+    project_id: UUID,
+    task_id: UUID,
+    container: Container = Depends(get_container),
+):
+    """
+    Delete a task of a project.
+    
+    Raises:
+        404: If the task is not found in the project.
+    """
+    try:
+        container.delete_task.execute(project_id, task_id)
+    except TaskNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
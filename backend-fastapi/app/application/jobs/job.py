@@ -0,0 +1,78 @@
+"""
+Background job - Application layer.
+
+A job tracks the progress of a long-running bulk operation that runs
+outside the HTTP request/response cycle.
+"""
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from app.domain.entities import utc_now
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle states."""
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+class Job:
+    """
+    Progress record for a background job.
+
+    A job is mutated only by its runner: state changes happen under the
+    runner's lock, progress only from the worker running it, so readers can
+    poll it without locking.
+    """
+
+    # Cap on recorded item errors so a failing bulk job cannot grow unbounded
+    MAX_ERRORS = 50
+
+    def __init__(self, kind: str, total: int):
+        self.id: UUID = uuid4()
+        self.kind = kind
+        self.status = JobStatus.QUEUED
+        self.total = total
+        self.processed = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self.created_at: datetime = utc_now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.cancel_requested = False
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job has reached a terminal state."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    def record_success(self) -> None:
+        """Count one item as processed successfully."""
+        self.processed += 1
+
+    def record_failure(self, error: str) -> None:
+        """Count one item as processed with an error."""
+        self.processed += 1
+        self.failed += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(error)
+
+    def mark_running(self) -> None:
+        """Move the job into the RUNNING state."""
+        self.status = JobStatus.RUNNING
+        self.started_at = utc_now()
+
+    def mark_finished(self, status: JobStatus, error: Optional[str] = None) -> None:
+        """Move the job into a terminal state, optionally recording an error."""
+        self.status = status
+        self.finished_at = utc_now()
+        if error is not None and len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(error)
+
+    def __repr__(self) -> str:
+        return f"Job(id={self.id}, kind='{self.kind}', status={self.status})"
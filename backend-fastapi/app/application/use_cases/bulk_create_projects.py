@@ -0,0 +1,52 @@
+"""
+Bulk Create Projects Use Case - Application layer.
+
+Encapsulates the business logic for importing many projects as a background job.
+"""
+from typing import List
+
+from app.application.jobs.job import Job
+from app.application.use_cases.create_project import CreateProjectUseCase
+from app.domain.entities import DEFAULT_WORKSPACE, ProjectStatus
+from app.domain.exceptions import WorkspaceQuotaExceededException
+from app.infrastructure.repositories.project_repository import ProjectRepository
+
+
+class BulkCreateProjectsUseCase:
+    """
+    Use case for creating a list of projects in batches.
+    
+    Each project goes through CreateProjectUseCase, so the usual domain
+    validation applies; invalid entries are recorded as failures without
+    stopping the import. A cancel request is honoured between batches.
+    """
+    
+    def __init__(self, repository: ProjectRepository, batch_size: int = 100):
+        self.create_project = CreateProjectUseCase(repository)
+        self.batch_size = batch_size
+    
+    def execute(self, projects: List[dict], job: Job) -> None:
+        """
+        Execute the use case.
+        
+        Args:
+            projects: Project data with ``name``, ``description``, ``status``
+                and ``workspace_id`` keys.
+            job: The job to report progress on.
+        """
+        for start in range(0, len(projects), self.batch_size):
+            if job.cancel_requested:
+                return
+            
+            for data in projects[start:start + self.batch_size]:
+                try:
+                    self.create_project.execute(
+                        name=data["name"],
+                        description=data["description"],
+                        status=data.get("status", ProjectStatus.PLANNED),
+                        workspace_id=data.get("workspace_id", DEFAULT_WORKSPACE),
+                    )
+                except (ValueError, WorkspaceQuotaExceededException) as e:
+                    job.record_failure(str(e))
+                else:
+                    job.record_success()
@@ -0,0 +1,53 @@
+"""
+Bulk Delete Projects Use Case - Application layer.
+
+Encapsulates the business logic for deleting many projects as a background job.
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.jobs.job import Job
+from app.application.use_cases.delete_project import DeleteProjectUseCase
+from app.domain.exceptions import ProjectNotFoundException
+from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.revision_repository import RevisionRepository
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+
+class BulkDeleteProjectsUseCase:
+    """
+    Use case for deleting a list of projects in batches.
+    
+    Each project goes through DeleteProjectUseCase. Progress is reported on
+    the job, and a cancel request is honoured between batches.
+    """
+    
+    def __init__(
+        self,
+        repository: ProjectRepository,
+        batch_size: int = 100,
+        task_repository: Optional[TaskRepository] = None,
+        revision_repository: Optional[RevisionRepository] = None,
+    ):
+        self.delete_project = DeleteProjectUseCase(repository, task_repository, revision_repository)
+        self.batch_size = batch_size
+    
+    def execute(self, project_ids: List[UUID], job: Job) -> None:
+        """
+        Execute the use case.
+        
+        Args:
+            project_ids: The UUIDs of the projects to delete.
+            job: The job to report progress on.
+        """
+        for start in range(0, len(project_ids), self.batch_size):
+            if job.cancel_requested:
+                return
+            
+            for project_id in project_ids[start:start + self.batch_size]:
+                try:
+                    self.delete_project.execute(project_id)
+                except ProjectNotFoundException as e:
+                    job.record_failure(str(e))
+                else:
+                    job.record_success()
@@ -3,7 +3,7 @@ Create Project Use Case - Application layer.
 
 Encapsulates the business logic for creating a new project.
 """
-from app.domain.entities import Project, ProjectStatus
+from app.domain.entities import DEFAULT_WORKSPACE, Project, ProjectStatus
 from app.infrastructure.repositories.project_repository import ProjectRepository
 
 
@@ -23,6 +23,7 @@ class CreateProjectUseCase:
         name: str,
         description: str,
         status: ProjectStatus = ProjectStatus.PLANNED,
+        workspace_id: str = DEFAULT_WORKSPACE,
     ) -> Project:
         """
         Execute the use case.
@@ -31,18 +32,21 @@ class CreateProjectUseCase:
             name: Project name.
             description: Project description.
             status: Project status (defaults to PLANNED).
+            workspace_id: Workspace the project belongs to.
             
         Returns:
             The newly created project.
             
         Raises:
             ValueError: If validation fails (handled by Project entity).
+            WorkspaceQuotaExceededException: If the workspace is over its quota.
         """
         # Create the domain entity (domain validation happens here)
         project = Project(
             name=name,
             description=description,
             status=status,
+            workspace_id=workspace_id,
         )
         
         # Persist the project
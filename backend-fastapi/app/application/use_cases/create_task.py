@@ -0,0 +1,56 @@
+"""
+Create Task Use Case - Application layer.
+
+Encapsulates the business logic for adding a task to a project.
+"""
+from uuid import UUID
+
+from app.domain.entities import Task, TaskStatus
+from app.domain.exceptions import ProjectNotFoundException
+from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+
+class CreateTaskUseCase:
+    """
+    Use case for creating a task inside an existing project.
+    """
+    
+    def __init__(self, project_repository: ProjectRepository, task_repository: TaskRepository):
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+    
+    def execute(
+        self,
+        project_id: UUID,
+        title: str,
+        status: TaskStatus = TaskStatus.TODO,
+    ) -> Task:
+        """
+        Execute the use case.
+        
+        Args:
+            project_id: The UUID of the owning project.
+            title: Task title.
+            status: Task status (defaults to TODO).
+            
+        Returns:
+            The newly created task.
+            
+        Raises:
+            ProjectNotFoundException: If the project doesn't exist.
+            ValueError: If validation fails (handled by Task entity).
+        """
+        if not self.project_repository.exists(project_id):
+            raise ProjectNotFoundException(str(project_id))
+        
+        task = Task(project_id=project_id, title=title, status=status)
+        saved = self.task_repository.save(task)
+        
+        # The project may have been deleted between the check and the save,
+        # after its tasks were already removed. Check again and clean up, so
+        # no task or rollup outlives its project.
+        if not self.project_repository.exists(project_id):
+            self.task_repository.delete_by_project(project_id)
+            raise ProjectNotFoundException(str(project_id))
+        return saved
@@ -3,21 +3,33 @@ Delete Project Use Case - Application layer.
 
 Encapsulates the business logic for deleting a project.
 """
+from typing import Optional
 from uuid import UUID
 
 from app.domain.exceptions import ProjectNotFoundException
 from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.revision_repository import RevisionRepository
+from app.infrastructure.repositories.task_repository import TaskRepository
 
 
 class DeleteProjectUseCase:
     """
     Use case for deleting a project.
     
-    Coordinates the removal of a project from persistence.
+    Coordinates the removal of a project from persistence. When task or
+    revision repositories are given, the project's tasks and history are
+    removed as well.
     """
     
-    def __init__(self, repository: ProjectRepository):
+    def __init__(
+        self,
+        repository: ProjectRepository,
+        task_repository: Optional[TaskRepository] = None,
+        revision_repository: Optional[RevisionRepository] = None,
+    ):
         self.repository = repository
+        self.task_repository = task_repository
+        self.revision_repository = revision_repository
     
     def execute(self, project_id: UUID) -> None:
         """
@@ -32,3 +44,8 @@ class DeleteProjectUseCase:
         # The repository's delete method will raise ProjectNotFoundException
         # if the project doesn't exist
         self.repository.delete(project_id)
+        
+        if self.task_repository is not None:
+            self.task_repository.delete_by_project(project_id)
+        if self.revision_repository is not None:
+            self.revision_repository.delete_by_project(project_id)
@@ -0,0 +1,39 @@
+"""
+Delete Task Use Case - Application layer.
+
+Encapsulates the business logic for deleting a task of a project.
+"""
+from uuid import UUID
+
+from app.domain.exceptions import TaskNotFoundException
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+
+class DeleteTaskUseCase:
+    """
+    Use case for deleting a task.
+    
+    The task must belong to the given project; otherwise it is reported
+    as not found.
+    """
+    
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+    
+    def execute(self, project_id: UUID, task_id: UUID) -> None:
+        """
+        Execute the use case.
+        
+        Args:
+            project_id: The UUID of the owning project.
+            task_id: The UUID of the task to delete.
+            
+        Raises:
+            TaskNotFoundException: If the task doesn't exist in the project.
+        """
+        task = self.task_repository.find_by_id(task_id)
+        
+        if task is None or task.project_id != project_id:
+            raise TaskNotFoundException(str(task_id))
+        
+        self.task_repository.delete(task_id)
@@ -0,0 +1,53 @@
+"""
+Get Project As Of Use Case - Application layer.
+
+Encapsulates the business logic for reading a project as it was at a
+point in time.
+"""
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.entities import Project, as_utc
+from app.domain.exceptions import ProjectNotFoundException
+from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.revision_repository import RevisionRepository
+
+
+class GetProjectAsOfUseCase:
+    """
+    Use case for rebuilding a past state of a project from its revisions.
+    """
+    
+    def __init__(self, repository: ProjectRepository, revision_repository: RevisionRepository):
+        self.repository = repository
+        self.revision_repository = revision_repository
+    
+    def execute(self, project_id: UUID, as_of: datetime) -> Project:
+        """
+        Execute the use case.
+        
+        Args:
+            project_id: The UUID of the project.
+            as_of: Point in time to read at (naive values are treated as UTC).
+            
+        Returns:
+            A detached Project holding the state in effect at ``as_of``.
+            
+        Raises:
+            ProjectNotFoundException: If the project doesn't exist, or
+                didn't exist yet at ``as_of``.
+        """
+        project = self.repository.find_by_id(project_id)
+        as_of = as_utc(as_of)
+        
+        if project is None or as_of < project.created_at:
+            raise ProjectNotFoundException(str(project_id))
+        
+        # Projects that were never updated have no history
+        state = self.revision_repository.find_state_as_of(project_id, as_of) or project.snapshot()
+        return Project(
+            id=project.id,
+            created_at=project.created_at,
+            workspace_id=project.workspace_id,
+            **state,
+        )
@@ -0,0 +1,41 @@
+"""
+Get Projects By IDs Use Case - Application layer.
+
+Encapsulates the business logic for retrieving many projects in one batch.
+"""
+from typing import List, Tuple
+from uuid import UUID
+
+from app.domain.entities import Project
+from app.infrastructure.repositories.project_repository import ProjectRepository
+
+
+class GetProjectsByIdsUseCase:
+    """
+    Use case for retrieving a batch of projects by ID.
+    
+    Unlike GetProjectUseCase, unknown IDs do not fail the request;
+    they are reported back to the caller instead.
+    """
+    
+    def __init__(self, repository: ProjectRepository):
+        self.repository = repository
+    
+    def execute(self, project_ids: List[UUID]) -> Tuple[List[Project], List[UUID]]:
+        """
+        Execute the use case.
+        
+        Args:
+            project_ids: The UUIDs of the projects to retrieve.
+            
+        Returns:
+            A tuple of the found projects (in request order, without
+            duplicates) and the IDs that were not found.
+        """
+        # Preserve request order while dropping duplicate IDs
+        unique_ids = list(dict.fromkeys(project_ids))
+        found = self.repository.find_by_ids(unique_ids)
+        
+        projects = [found[project_id] for project_id in unique_ids if project_id in found]
+        missing_ids = [project_id for project_id in unique_ids if project_id not in found]
+        return projects, missing_ids
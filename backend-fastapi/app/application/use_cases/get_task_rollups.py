@@ -0,0 +1,34 @@
+"""
+Get Task Rollups Use Case - Application layer.
+
+Encapsulates the business logic for reading task progress of many projects.
+"""
+from typing import Dict, List
+from uuid import UUID
+
+from app.domain.entities import TaskRollup
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+
+class GetTaskRollupsUseCase:
+    """
+    Use case for reading task counts and completion for a page of projects.
+    
+    All rollups are fetched with a single repository call, however many
+    projects are on the page.
+    """
+    
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+    
+    def execute(self, project_ids: List[UUID]) -> Dict[UUID, TaskRollup]:
+        """
+        Execute the use case.
+        
+        Args:
+            project_ids: The UUIDs of the projects.
+            
+        Returns:
+            A rollup for every requested project.
+        """
+        return self.task_repository.get_rollups(project_ids)
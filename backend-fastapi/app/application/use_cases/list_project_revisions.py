@@ -0,0 +1,40 @@
+"""
+List Project Revisions Use Case - Application layer.
+
+Encapsulates the business logic for retrieving a project's change history.
+"""
+from typing import List
+from uuid import UUID
+
+from app.domain.entities import ProjectRevision
+from app.domain.exceptions import ProjectNotFoundException
+from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.revision_repository import RevisionRepository
+
+
+class ListProjectRevisionsUseCase:
+    """
+    Use case for listing the recorded revisions of a project.
+    """
+    
+    def __init__(self, repository: ProjectRepository, revision_repository: RevisionRepository):
+        self.repository = repository
+        self.revision_repository = revision_repository
+    
+    def execute(self, project_id: UUID) -> List[ProjectRevision]:
+        """
+        Execute the use case.
+        
+        Args:
+            project_id: The UUID of the project.
+            
+        Returns:
+            The project's revisions, oldest first. Empty if it was never updated.
+            
+        Raises:
+            ProjectNotFoundException: If the project doesn't exist.
+        """
+        if not self.repository.exists(project_id):
+            raise ProjectNotFoundException(str(project_id))
+        
+        return self.revision_repository.find_by_project(project_id)
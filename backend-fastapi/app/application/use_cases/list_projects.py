@@ -3,9 +3,10 @@ List Projects Use Case - Application layer.
 
 Encapsulates the business logic for retrieving all projects.
 """
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from app.domain.entities import Project
+from app.domain.entities import Project, as_utc
 from app.infrastructure.repositories.project_repository import ProjectRepository
 
 
@@ -20,11 +21,37 @@ class ListProjectsUseCase:
     def __init__(self, repository: ProjectRepository):
         self.repository = repository
     
-    def execute(self) -> List[Project]:
+    def execute(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        workspace_id: Optional[str] = None,
+    ) -> List[Project]:
         """
         Execute the use case.
         
+        Args:
+            created_after: Only include projects created at or after this time (optional).
+            created_before: Only include projects created before this time (optional).
+            workspace_id: Only include projects of this workspace (optional).
+            
         Returns:
-            List of all projects, typically sorted by creation date.
+            List of matching projects, sorted by creation date (newest first).
+            
+        Raises:
+            ValueError: If created_after is later than created_before.
         """
-        return self.repository.find_all()
+        # Naive datetimes are treated as UTC so they compare with stored timestamps
+        if created_after is not None:
+            created_after = as_utc(created_after)
+        if created_before is not None:
+            created_before = as_utc(created_before)
+        
+        if created_after and created_before and created_after > created_before:
+            raise ValueError("created_after must not be later than created_before")
+        
+        return self.repository.find_all(
+            created_after=created_after,
+            created_before=created_before,
+            workspace_id=workspace_id,
+        )
@@ -0,0 +1,40 @@
+"""
+List Tasks Use Case - Application layer.
+
+Encapsulates the business logic for retrieving the tasks of a project.
+"""
+from typing import List
+from uuid import UUID
+
+from app.domain.entities import Task
+from app.domain.exceptions import ProjectNotFoundException
+from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+
+class ListTasksUseCase:
+    """
+    Use case for listing the tasks of a project.
+    """
+    
+    def __init__(self, project_repository: ProjectRepository, task_repository: TaskRepository):
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+    
+    def execute(self, project_id: UUID) -> List[Task]:
+        """
+        Execute the use case.
+        
+        Args:
+            project_id: The UUID of the project.
+            
+        Returns:
+            The project's tasks in creation order.
+            
+        Raises:
+            ProjectNotFoundException: If the project doesn't exist.
+        """
+        if not self.project_repository.exists(project_id):
+            raise ProjectNotFoundException(str(project_id))
+        
+        return self.task_repository.find_by_project(project_id)
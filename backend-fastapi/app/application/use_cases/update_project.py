@@ -3,12 +3,13 @@ Update Project Use Case - Application layer.
 
 Encapsulates the business logic for updating an existing project.
 """
-from typing import Optional
+from typing import Collection, Optional
 from uuid import UUID
 
-from app.domain.entities import Project, ProjectStatus
-from app.domain.exceptions import ProjectNotFoundException
+from app.domain.entities import Project, ProjectStatus, utc_now
+from app.domain.exceptions import ProjectNotFoundException, ProjectVersionConflictException
 from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.revision_repository import RevisionRepository
 
 
 class UpdateProjectUseCase:
@@ -16,11 +17,30 @@ class UpdateProjectUseCase:
     Use case for updating an existing project.
     
     This retrieves the project, applies updates using domain logic,
-    and persists the changes.
+    and persists the changes. When a revision repository is given, the
+    fields that actually changed are recorded as a new revision.
+    
+    Writes use optimistic concurrency: the edit is applied to a detached
+    copy and saved only if the stored version is still the one that was
+    read. A conflicting write is retried on fresh data, so concurrent
+    partial updates never overwrite each other; callers that pass expected
+    versions still only update from one of those.
+    
+    Unconditional updates retry until they land: every conflict means
+    another writer succeeded, so the loop always makes progress. Conditional
+    updates give up after ``MAX_ATTEMPTS`` conflicts in a row, since the
+    caller asked for a specific version and can re-read and decide.
     """
     
-    def __init__(self, repository: ProjectRepository):
+    MAX_ATTEMPTS = 10
+    
+    def __init__(
+        self,
+        repository: ProjectRepository,
+        revision_repository: Optional[RevisionRepository] = None,
+    ):
         self.repository = repository
+        self.revision_repository = revision_repository
     
     def execute(
         self,
@@ -28,6 +48,7 @@ class UpdateProjectUseCase:
         name: Optional[str] = None,
         description: Optional[str] = None,
         status: Optional[ProjectStatus] = None,
+        expected_versions: Optional[Collection[int]] = None,
     ) -> Project:
         """
         Execute the use case.
@@ -37,6 +58,9 @@ class UpdateProjectUseCase:
             name: New name (optional).
             description: New description (optional).
             status: New status (optional).
+            expected_versions: Versions the caller accepts updating from
+                (optional), e.g. the one it last read. When given, the update
+                is rejected unless the project is at one of them.
             
         Returns:
             The updated project.
@@ -44,15 +68,58 @@ class UpdateProjectUseCase:
         Raises:
             ProjectNotFoundException: If the project doesn't exist.
             ValueError: If validation fails.
+            WorkspaceQuotaExceededException: If the workspace is over its quota.
+            ProjectVersionConflictException: If ``expected_versions`` is given
+                and the project is not at one of them, or kept changing for
+                ``MAX_ATTEMPTS`` attempts.
         """
-        # Retrieve the existing project
-        project = self.repository.find_by_id(project_id)
-        
-        if project is None:
-            raise ProjectNotFoundException(str(project_id))
+        attempts = 0
+        while True:
+            # Retrieve the existing project
+            current = self.repository.find_by_id(project_id)
+            
+            if current is None:
+                raise ProjectNotFoundException(str(project_id))
+            
+            if expected_versions is not None and current.version not in expected_versions:
+                raise ProjectVersionConflictException(
+                    str(project_id), expected_versions, current.version
+                )
+            
+            previous_state = current.snapshot()
+            
+            # Update a copy using domain logic (validation happens in entity);
+            # the stored instance stays untouched until the swap succeeds
+            project = current.copy()
+            project.update(name=name, description=description, status=status)
+            
+            # Persist the changes if nobody else wrote in the meantime
+            try:
+                saved = self.repository.save_if_version(project, current.version)
+                changed_at = utc_now()
+                break
+            except ProjectVersionConflictException:
+                attempts += 1
+                if expected_versions is not None and attempts >= self.MAX_ATTEMPTS:
+                    raise
+                # Re-read; the precondition is checked again on the new version
         
-        # Update using domain logic (validation happens in entity)
-        project.update(name=name, description=description, status=status)
+        if self.revision_repository is not None:
+            changes = {
+                field: value
+                for field, value in saved.snapshot().items()
+                if value != previous_state[field]
+            }
+            if changes:
+                self.revision_repository.record_change(
+                    project_id=saved.id,
+                    previous_state=previous_state,
+                    changes=changes,
+                    changed_at=changed_at,
+                    created_at=saved.created_at,
+                    # Concurrent updates may get here in any order; the
+                    # version puts each revision in its place
+                    version=saved.version,
+                )
         
-        # Persist the changes
-        return self.repository.save(project)
+        return saved
@@ -0,0 +1,54 @@
+"""
+Update Task Use Case - Application layer.
+
+Encapsulates the business logic for updating a task of a project.
+"""
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities import Task, TaskStatus
+from app.domain.exceptions import TaskNotFoundException
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+
+class UpdateTaskUseCase:
+    """
+    Use case for updating an existing task.
+    
+    The task must belong to the given project; otherwise it is reported
+    as not found.
+    """
+    
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+    
+    def execute(
+        self,
+        project_id: UUID,
+        task_id: UUID,
+        title: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+    ) -> Task:
+        """
+        Execute the use case.
+        
+        Args:
+            project_id: The UUID of the owning project.
+            task_id: The UUID of the task to update.
+            title: New title (optional).
+            status: New status (optional).
+            
+        Returns:
+            The updated task.
+            
+        Raises:
+            TaskNotFoundException: If the task doesn't exist in the project.
+            ValueError: If validation fails.
+        """
+        task = self.task_repository.find_by_id(task_id)
+        
+        if task is None or task.project_id != project_id:
+            raise TaskNotFoundException(str(task_id))
+        
+        task.update(title=title, status=status)
+        return self.task_repository.save(task)
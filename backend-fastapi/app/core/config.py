@@ -4,6 +4,8 @@ Application configuration.
 Centralizes configuration settings that might come from
 environment variables or config files.
 """
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -24,6 +26,46 @@ class Settings(BaseSettings):
         "https://nexure-ai.github.io",
     ]
     
+    # Storage Settings
+    # "memory" keeps every project in memory; "tiered" moves old DONE
+    # projects to a compressed segment file on disk
+    repository_backend: Literal["memory", "tiered"] = "memory"
+    # Directory for cold segment files (unset for the system temp directory).
+    # Each process creates its own file there and deletes it on shutdown.
+    cold_storage_dir: Optional[str] = None
+    # Age (by creation date) after which DONE projects move to cold storage
+    cold_after_days: int = 30
+    # Number of writes between sweeps that move projects to cold storage
+    cold_sweep_every: int = 1000
+    
+    # Revision History Settings
+    # Every Nth revision stores the full project state; point-in-time reads
+    # replay at most N-1 deltas on top of the nearest one
+    revision_checkpoint_interval: int = 32
+    
+    # Workspace Settings
+    # Estimated bytes of project data each workspace may keep in memory
+    # (unset for no limit)
+    workspace_max_bytes: Optional[int] = None
+    
+    # Startup Settings
+    # Build the repository and serialization paths before serving traffic
+    warm_up_on_startup: bool = True
+    # Optional JSON file of projects loaded into an empty repository at startup
+    seed_data_path: Optional[str] = None
+    
+    # Background Job Settings
+    # Worker threads running bulk jobs, separate from the request threadpool
+    job_workers: int = 2
+    # Maximum number of jobs waiting to run; further submissions are rejected
+    job_queue_size: int = 100
+    # Number of items a bulk job processes between progress/cancel checks
+    job_batch_size: int = 100
+    # Number of finished jobs kept for status polling
+    job_history_size: int = 1000
+    # Seconds to wait for running jobs to reach a batch boundary on shutdown
+    job_shutdown_timeout: float = 10.0
+    
     # Database Settings (for future use)
     # database_url: str = "sqlite:///./projects.db"
     
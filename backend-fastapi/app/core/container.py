@@ -0,0 +1,122 @@
+"""
+Composition root.
+
+Builds the adapters (repositories, job runner) and the use-case singletons
+once, from Settings, so request handlers only look them up.
+"""
+from datetime import timedelta
+from typing import Optional
+
+from app.core.config import Settings
+from app.application.use_cases.bulk_create_projects import BulkCreateProjectsUseCase
+from app.application.use_cases.bulk_delete_projects import BulkDeleteProjectsUseCase
+from app.application.use_cases.create_project import CreateProjectUseCase
+from app.application.use_cases.create_task import CreateTaskUseCase
+from app.application.use_cases.delete_project import DeleteProjectUseCase
+from app.application.use_cases.delete_task import DeleteTaskUseCase
+from app.application.use_cases.get_project import GetProjectUseCase
+from app.application.use_cases.get_project_as_of import GetProjectAsOfUseCase
+from app.application.use_cases.get_projects_by_ids import GetProjectsByIdsUseCase
+from app.application.use_cases.get_task_rollups import GetTaskRollupsUseCase
+from app.application.use_cases.list_project_revisions import ListProjectRevisionsUseCase
+from app.application.use_cases.list_projects import ListProjectsUseCase
+from app.application.use_cases.list_tasks import ListTasksUseCase
+from app.application.use_cases.update_project import UpdateProjectUseCase
+from app.application.use_cases.update_task import UpdateTaskUseCase
+from app.infrastructure.jobs.job_runner import JobRunner
+from app.infrastructure.repositories.project_repository import (
+    InMemoryProjectRepository,
+    ProjectRepository,
+)
+from app.infrastructure.repositories.revision_repository import (
+    InMemoryRevisionRepository,
+    RevisionRepository,
+)
+from app.infrastructure.repositories.task_repository import (
+    InMemoryTaskRepository,
+    TaskRepository,
+)
+
+
+def build_project_repository(settings: Settings) -> ProjectRepository:
+    """Create the project repository selected by ``settings.repository_backend``."""
+    if settings.repository_backend == "tiered":
+        from app.infrastructure.repositories.tiered_project_repository import (
+            TieredProjectRepository,
+        )
+
+        return TieredProjectRepository(
+            segment_dir=settings.cold_storage_dir,
+            cold_after=timedelta(days=settings.cold_after_days),
+            sweep_every=settings.cold_sweep_every,
+            max_workspace_bytes=settings.workspace_max_bytes,
+        )
+    return InMemoryProjectRepository(max_workspace_bytes=settings.workspace_max_bytes)
+
+
+class Container:
+    """
+    Application object graph.
+
+    Any adapter can be passed in to replace the one built from settings,
+    which is how tests swap in fresh repositories. Use cases hold no
+    per-request state, so one instance of each serves every request.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        repository: Optional[ProjectRepository] = None,
+        task_repository: Optional[TaskRepository] = None,
+        revision_repository: Optional[RevisionRepository] = None,
+        job_runner: Optional[JobRunner] = None,
+    ):
+        self.settings = settings
+
+        # Adapters
+        self.repository = repository or build_project_repository(settings)
+        self.task_repository = task_repository or InMemoryTaskRepository()
+        self.revision_repository = revision_repository or InMemoryRevisionRepository(
+            checkpoint_interval=settings.revision_checkpoint_interval,
+        )
+        self.job_runner = job_runner or JobRunner(
+            workers=settings.job_workers,
+            queue_size=settings.job_queue_size,
+            history_size=settings.job_history_size,
+        )
+
+        # Project use cases
+        self.list_projects = ListProjectsUseCase(self.repository)
+        self.get_project = GetProjectUseCase(self.repository)
+        self.get_project_as_of = GetProjectAsOfUseCase(self.repository, self.revision_repository)
+        self.get_projects_by_ids = GetProjectsByIdsUseCase(self.repository)
+        self.create_project = CreateProjectUseCase(self.repository)
+        self.update_project = UpdateProjectUseCase(self.repository, self.revision_repository)
+        self.delete_project = DeleteProjectUseCase(
+            self.repository, self.task_repository, self.revision_repository
+        )
+        self.list_project_revisions = ListProjectRevisionsUseCase(
+            self.repository, self.revision_repository
+        )
+
+        # Task use cases
+        self.list_tasks = ListTasksUseCase(self.repository, self.task_repository)
+        self.create_task = CreateTaskUseCase(self.repository, self.task_repository)
+        self.update_task = UpdateTaskUseCase(self.task_repository)
+        self.delete_task = DeleteTaskUseCase(self.task_repository)
+        self.get_task_rollups = GetTaskRollupsUseCase(self.task_repository)
+
+        # Bulk use cases run by background jobs
+        self.bulk_create_projects = BulkCreateProjectsUseCase(
+            self.repository, batch_size=settings.job_batch_size
+        )
+        self.bulk_delete_projects = BulkDeleteProjectsUseCase(
+            self.repository,
+            batch_size=settings.job_batch_size,
+            task_repository=self.task_repository,
+            revision_repository=self.revision_repository,
+        )
+
+    def close(self) -> None:
+        """Release adapter resources; called once the app has shut down."""
+        self.repository.close()
@@ -1,12 +1,32 @@
 """
 Domain entities - Core business objects independent of frameworks.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID, uuid4
 
 
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Normalize a datetime to timezone-aware UTC.
+    
+    Naive datetimes are assumed to already be expressed in UTC.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+# Workspace used when a project is created without one
+DEFAULT_WORKSPACE = "default"
+
+
 class ProjectStatus(str, Enum):
     """Project status enumeration."""
     PLANNED = "PLANNED"
@@ -20,6 +40,12 @@ class Project:
     
     This is a pure domain object with no dependencies on infrastructure
     or frameworks. It encapsulates business rules and validations.
+    
+    Every project belongs to one workspace (tenant) for its whole lifetime.
+    
+    ``version`` counts stored updates. Repositories advance it on every
+    conditional save, so a writer can detect that the project changed
+    since it was read.
     """
     
     def __init__(
@@ -29,6 +55,8 @@ class Project:
         status: ProjectStatus,
         id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
+        workspace_id: str = DEFAULT_WORKSPACE,
+        version: int = 1,
     ):
         if not name or not name.strip():
             raise ValueError("Project name cannot be empty")
@@ -36,11 +64,16 @@ class Project:
         if not description or not description.strip():
             raise ValueError("Project description cannot be empty")
         
+        if not workspace_id or not workspace_id.strip():
+            raise ValueError("Project workspace cannot be empty")
+        
         self.id = id or uuid4()
+        self.workspace_id = workspace_id.strip()
         self.name = name.strip()
         self.description = description.strip()
         self.status = status
-        self.created_at = created_at or datetime.utcnow()
+        self.created_at = as_utc(created_at) if created_at else utc_now()
+        self.version = version
     
     def update(
         self,
@@ -62,5 +95,134 @@ class Project:
         if status is not None:
             self.status = status
     
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the editable fields, as recorded by revision history."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "status": self.status,
+        }
+    
+    def copy(self) -> "Project":
+        """Return a detached copy, so edits do not touch a stored instance."""
+        return Project(
+            name=self.name,
+            description=self.description,
+            status=self.status,
+            id=self.id,
+            created_at=self.created_at,
+            workspace_id=self.workspace_id,
+            version=self.version,
+        )
+    
+    def __repr__(self) -> str:
+        return f"Project(id={self.id}, name='{self.name}', status={self.status}, version={self.version})"
+
+
+class ProjectRevision:
+    """
+    A recorded change to a project's editable fields.
+    
+    ``changes`` holds only the fields that changed, with their new values.
+    Checkpoint revisions additionally carry the full ``state`` after the
+    change, so a past state can be rebuilt from the nearest checkpoint.
+    ``version`` is the project version the revision produced.
+    """
+    
+    __slots__ = ("number", "version", "changed_at", "changes", "state")
+    
+    def __init__(
+        self,
+        number: int,
+        version: int,
+        changed_at: datetime,
+        changes: Dict[str, Any],
+        state: Optional[Dict[str, Any]] = None,
+    ):
+        self.number = number
+        self.version = version
+        self.changed_at = changed_at
+        self.changes = changes
+        self.state = state
+    
+    @property
+    def is_checkpoint(self) -> bool:
+        """Whether this revision stores the full state."""
+        return self.state is not None
+    
+    def __repr__(self) -> str:
+        return f"ProjectRevision(number={self.number}, version={self.version}, changes={sorted(self.changes)})"
+
+
+class TaskStatus(str, Enum):
+    """Task status enumeration."""
+    TODO = "TODO"
+    IN_PROGRESS = "IN_PROGRESS"
+    DONE = "DONE"
+
+
+class Task:
+    """
+    Task entity - a unit of work inside a project.
+    
+    A task belongs to exactly one project for its whole lifetime.
+    """
+    
+    def __init__(
+        self,
+        project_id: UUID,
+        title: str,
+        status: TaskStatus = TaskStatus.TODO,
+        id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+    ):
+        if not title or not title.strip():
+            raise ValueError("Task title cannot be empty")
+        
+        self.id = id or uuid4()
+        self.project_id = project_id
+        self.title = title.strip()
+        self.status = status
+        self.created_at = as_utc(created_at) if created_at else utc_now()
+    
+    def update(
+        self,
+        title: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+    ) -> None:
+        """Update task fields with validation."""
+        if title is not None:
+            if not title.strip():
+                raise ValueError("Task title cannot be empty")
+            self.title = title.strip()
+        
+        if status is not None:
+            self.status = status
+    
+    def __repr__(self) -> str:
+        return f"Task(id={self.id}, project_id={self.project_id}, title='{self.title}', status={self.status})"
+
+
+class TaskRollup:
+    """
+    Aggregate task progress for one project.
+    
+    A value object maintained by task repositories as tasks change, so
+    project listings can show progress without loading the tasks.
+    """
+    
+    __slots__ = ("total", "done")
+    
+    def __init__(self, total: int = 0, done: int = 0):
+        self.total = total
+        self.done = done
+    
+    @property
+    def percent_complete(self) -> float:
+        """Share of tasks that are DONE, as a percentage rounded to one decimal."""
+        if self.total == 0:
+            return 0.0
+        return round(self.done * 100 / self.total, 1)
+    
     def __repr__(self) -> str:
-        return f"Project(id={self.id}, name='{self.name}', status={self.status})"
+        return f"TaskRollup(total={self.total}, done={self.done})"
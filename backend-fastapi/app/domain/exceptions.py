@@ -1,6 +1,7 @@
 """
 Domain-specific exceptions.
 """
+from typing import Collection
 
 
 class DomainException(Exception):
@@ -16,9 +17,64 @@ class ProjectNotFoundException(DomainException):
         super().__init__(f"Project with id '{project_id}' not found")
 
 
+class TaskNotFoundException(DomainException):
+    """Raised when a task is not found."""
+    
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        super().__init__(f"Task with id '{task_id}' not found")
+
+
 class ProjectAlreadyExistsException(DomainException):
     """Raised when attempting to create a project that already exists."""
     
     def __init__(self, project_id: str):
         self.project_id = project_id
         super().__init__(f"Project with id '{project_id}' already exists")
+
+
+class WorkspaceQuotaExceededException(DomainException):
+    """Raised when a write would take a workspace over its storage quota."""
+    
+    def __init__(self, workspace_id: str, limit_bytes: int):
+        self.workspace_id = workspace_id
+        self.limit_bytes = limit_bytes
+        super().__init__(f"Workspace '{workspace_id}' would exceed its quota of {limit_bytes} bytes")
+
+
+class ProjectVersionConflictException(DomainException):
+    """Raised when a conditional update finds the project at another version."""
+    
+    def __init__(self, project_id: str, expected_versions: Collection[int], actual_version: int):
+        self.project_id = project_id
+        self.expected_versions = sorted(expected_versions)
+        self.actual_version = actual_version
+        expected = ", ".join(str(version) for version in self.expected_versions) or "none"
+        super().__init__(
+            f"Project with id '{project_id}' is at version {actual_version}, "
+            f"expected version {expected}"
+        )
+
+
+class JobNotFoundException(DomainException):
+    """Raised when a background job is not found."""
+    
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        super().__init__(f"Job with id '{job_id}' not found")
+
+
+class JobQueueFullException(DomainException):
+    """Raised when the background job queue cannot accept more jobs."""
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        super().__init__(f"Job queue is full ({capacity} jobs waiting)")
+
+
+class JobAlreadyFinishedException(DomainException):
+    """Raised when attempting to cancel a job that has already finished."""
+    
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        super().__init__(f"Job with id '{job_id}' has already finished")
@@ -0,0 +1,186 @@
+"""
+Job runner - Infrastructure layer.
+
+Runs background jobs on a dedicated pool of worker threads fed by a
+bounded queue, so long bulk operations never occupy the request threadpool.
+"""
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+from uuid import UUID
+
+from app.application.jobs.job import Job, JobStatus
+from app.domain.exceptions import (
+    JobAlreadyFinishedException,
+    JobNotFoundException,
+    JobQueueFullException,
+)
+
+
+JobWork = Callable[[Job], None]
+
+
+class JobRunner:
+    """
+    In-process job runner backed by a worker thread pool.
+
+    Jobs wait in a FIFO queue of bounded capacity; submissions beyond it
+    are rejected rather than blocking the caller. Cancelling a queued job
+    finishes it and frees its slot at once; workers skip it when they reach
+    it. The runner keeps every queued or running job plus the most recent
+    finished ones for status polling.
+    """
+
+    def __init__(self, workers: int = 2, queue_size: int = 100, history_size: int = 1000):
+        self._workers = workers
+        self._queue_size = queue_size
+        self._history_size = history_size
+        # Unbounded so cancelled jobs can stay in it; capacity is enforced
+        # on the count of jobs still QUEUED instead
+        self._queue: "queue.Queue[Optional[tuple[Job, JobWork]]]" = queue.Queue()
+        self._waiting = 0
+        self._jobs: "OrderedDict[UUID, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads. Safe to call more than once."""
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self._workers):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"job-worker-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers.
+
+        Queued jobs are cancelled and running jobs stop at their next
+        batch boundary.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+            for job in self._jobs.values():
+                if job.status == JobStatus.QUEUED:
+                    self._cancel_queued(job)
+                elif not job.is_finished:
+                    job.cancel_requested = True
+
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, kind: str, total: int, work: JobWork) -> Job:
+        """
+        Queue a job for execution.
+
+        Args:
+            kind: Short job type name, reported back to clients.
+            total: Number of items the job will process.
+            work: Callable that performs the job, updating its progress.
+
+        Returns:
+            The queued job.
+
+        Raises:
+            JobQueueFullException: If the queue is at capacity.
+        """
+        self.start()
+        job = Job(kind=kind, total=total)
+
+        with self._lock:
+            if self._waiting >= self._queue_size:
+                raise JobQueueFullException(self._queue_size)
+            self._waiting += 1
+            self._queue.put_nowait((job, work))
+            self._jobs[job.id] = job
+            self._prune_history()
+
+        return job
+
+    def get(self, job_id: UUID) -> Job:
+        """
+        Get a job by ID.
+
+        Raises:
+            JobNotFoundException: If the job is unknown or has been pruned.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundException(str(job_id))
+        return job
+
+    def cancel(self, job_id: UUID) -> Job:
+        """
+        Request cancellation of a job.
+
+        Queued jobs are finished as CANCELLED straight away and never
+        start; running jobs stop at their next batch boundary.
+
+        Raises:
+            JobNotFoundException: If the job is unknown.
+            JobAlreadyFinishedException: If the job has already finished.
+        """
+        job = self.get(job_id)
+        with self._lock:
+            if job.is_finished:
+                raise JobAlreadyFinishedException(str(job_id))
+            if job.status == JobStatus.QUEUED:
+                self._cancel_queued(job)
+                self._prune_history()
+            else:
+                job.cancel_requested = True
+        return job
+
+    def _worker_loop(self) -> None:
+        """Take jobs off the queue and run them until a stop sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            job, work = item
+            with self._lock:
+                if job.is_finished:
+                    # Cancelled while it was waiting
+                    continue
+                self._waiting -= 1
+                job.mark_running()
+            try:
+                work(job)
+            except Exception as e:
+                job.mark_finished(JobStatus.FAILED, error=str(e))
+            else:
+                job.mark_finished(
+                    JobStatus.CANCELLED if job.cancel_requested else JobStatus.SUCCEEDED
+                )
+            self._forget_finished()
+
+    def _cancel_queued(self, job: Job) -> None:
+        """Finish a job that has not started and free its slot. Caller holds the lock."""
+        job.cancel_requested = True
+        job.mark_finished(JobStatus.CANCELLED)
+        self._waiting -= 1
+
+    def _forget_finished(self) -> None:
+        """Prune the job history after a job finishes."""
+        with self._lock:
+            self._prune_history()
+
+    def _prune_history(self) -> None:
+        """Forget the oldest finished jobs beyond the history size. Caller holds the lock."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        excess = len(finished) - self._history_size
+        if excess <= 0:
+            return
+
+        for job_id in finished[:excess]:
+            del self._jobs[job_id]
@@ -0,0 +1,200 @@
+"""
+Cold segment store - Infrastructure layer.
+
+Stores rarely read projects as zlib-compressed blocks in an append-only
+segment file, with an in-memory id -> (offset, length) index.
+"""
+import json
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities import Project, ProjectStatus
+
+
+# Preset dictionary: the JSON skeleton every record shares, so even short
+# records compress well on their own.
+_ZDICT = (
+    b'{"id": "", "workspace_id": "default", "name": "", "description": "", '
+    b'"status": "DONE", "created_at": "+00:00", "version": 1}'
+)
+
+# Each block is a 4-byte big-endian payload length followed by the payload
+_HEADER = struct.Struct(">I")
+
+
+def _encode(project: Project) -> bytes:
+    """Serialize a project into a compressed block payload."""
+    record = {
+        "id": str(project.id),
+        "workspace_id": project.workspace_id,
+        "name": project.name,
+        "description": project.description,
+        "status": project.status.value,
+        "created_at": project.created_at.isoformat(),
+        "version": project.version,
+    }
+    compressor = zlib.compressobj(level=6, zdict=_ZDICT)
+    return compressor.compress(json.dumps(record).encode("utf-8")) + compressor.flush()
+
+
+def _decode(payload: bytes) -> Project:
+    """Rebuild a project from a compressed block payload."""
+    decompressor = zlib.decompressobj(zdict=_ZDICT)
+    record = json.loads(decompressor.decompress(payload) + decompressor.flush())
+    return Project(
+        name=record["name"],
+        description=record["description"],
+        status=ProjectStatus(record["status"]),
+        id=UUID(record["id"]),
+        created_at=datetime.fromisoformat(record["created_at"]),
+        workspace_id=record["workspace_id"],
+        version=record["version"],
+    )
+
+
+class ColdSegmentStore:
+    """
+    Append-only, compressed on-disk store for projects.
+
+    The segment file is scratch space that extends memory, not a durable
+    store: every store creates its own uniquely named file in ``directory``
+    (the system temp directory by default) and deletes it on close, matching
+    the lifetime of the in-memory tier it backs. Separate processes, such as
+    several server workers, therefore never share or truncate a segment.
+    Removed records leave dead bytes behind that are reclaimed by compaction
+    once they outweigh live data.
+    """
+
+    # Compaction is skipped while the file is smaller than this
+    MIN_COMPACTION_BYTES = 1 << 20
+
+    def __init__(self, directory: Optional[str] = None):
+        fd, self._path = tempfile.mkstemp(prefix="cold_projects-", suffix=".seg", dir=directory)
+        self._file = os.fdopen(fd, "w+b")
+        self._index: Dict[UUID, Tuple[int, int]] = {}
+        self._size = 0
+        self._dead_bytes = 0
+        # File offsets are shared state, so reads and writes are serialized
+        self._lock = threading.Lock()
+
+    def __contains__(self, project_id: UUID) -> bool:
+        return project_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def path(self) -> str:
+        """Location of this store's segment file."""
+        return self._path
+
+    @property
+    def file_size(self) -> int:
+        """Current size of the segment file in bytes."""
+        return self._size
+
+    @staticmethod
+    def encode(projects: Iterable[Project]) -> List[Tuple[UUID, bytes]]:
+        """Compress projects into blocks for ``append_encoded``."""
+        return [(project.id, _encode(project)) for project in projects]
+
+    def append(self, projects: Iterable[Project]) -> None:
+        """Write projects to the end of the segment with a single write call."""
+        # Compress outside the lock; only the file write is serialized
+        self.append_encoded(self.encode(projects))
+
+    def append_encoded(self, payloads: Iterable[Tuple[UUID, bytes]]) -> None:
+        """Write blocks produced by ``encode`` to the end of the segment."""
+        with self._lock:
+            chunks = []
+            offset = self._size
+            for project_id, payload in payloads:
+                chunks.append(_HEADER.pack(len(payload)))
+                chunks.append(payload)
+                self._discard(project_id)
+                self._index[project_id] = (offset + _HEADER.size, len(payload))
+                offset += _HEADER.size + len(payload)
+
+            self._file.seek(self._size)
+            self._file.write(b"".join(chunks))
+            self._file.flush()
+            self._size = offset
+
+    def read(self, project_id: UUID) -> Optional[Project]:
+        """Load a project from the segment, or None if it is not stored here."""
+        with self._lock:
+            location = self._index.get(project_id)
+            if location is None:
+                return None
+            offset, length = location
+            self._file.seek(offset)
+            payload = self._file.read(length)
+        return _decode(payload)
+
+    def read_many(self, project_ids: Iterable[UUID]) -> Dict[UUID, Project]:
+        """
+        Load several projects, reading their blocks in file order.
+
+        Only the file reads hold the lock; decompression happens after it
+        is released. Ids not stored here are absent from the result.
+        """
+        with self._lock:
+            locations = sorted(
+                (location, project_id)
+                for project_id in project_ids
+                if (location := self._index.get(project_id)) is not None
+            )
+            payloads = []
+            for (offset, length), project_id in locations:
+                self._file.seek(offset)
+                payloads.append((project_id, self._file.read(length)))
+        return {project_id: _decode(payload) for project_id, payload in payloads}
+
+    def remove(self, project_id: UUID) -> bool:
+        """Forget a project. Returns False if it was not stored here."""
+        with self._lock:
+            if project_id not in self._index:
+                return False
+            self._discard(project_id)
+            if self._dead_bytes > self.MIN_COMPACTION_BYTES and self._dead_bytes * 2 > self._size:
+                self._compact()
+            return True
+
+    def close(self) -> None:
+        """Close and delete the segment file. Safe to call more than once."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            os.unlink(self._path)
+
+    def _discard(self, project_id: UUID) -> None:
+        """Drop an index entry and account for its bytes. Caller holds the lock."""
+        location = self._index.pop(project_id, None)
+        if location is not None:
+            self._dead_bytes += _HEADER.size + location[1]
+
+    def _compact(self) -> None:
+        """Rewrite the segment with live blocks only. Caller holds the lock."""
+        blocks = []
+        for project_id, (offset, length) in self._index.items():
+            self._file.seek(offset)
+            blocks.append((project_id, self._file.read(length)))
+
+        self._file.seek(0)
+        self._file.truncate()
+        position = 0
+        for project_id, payload in blocks:
+            self._file.write(_HEADER.pack(len(payload)))
+            self._file.write(payload)
+            self._index[project_id] = (position + _HEADER.size, len(payload))
+            position += _HEADER.size + len(payload)
+        self._file.flush()
+        self._size = position
+        self._dead_bytes = 0
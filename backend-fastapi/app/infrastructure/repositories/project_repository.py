@@ -4,12 +4,21 @@ Project repository - Infrastructure layer.
 Defines the repository interface (port) and provides an in-memory implementation.
 This can be easily swapped with a database implementation later.
 """
+import heapq
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from app.domain.entities import Project
-from app.domain.exceptions import ProjectNotFoundException, ProjectAlreadyExistsException
+from app.domain.exceptions import (
+    ProjectNotFoundException,
+    ProjectAlreadyExistsException,
+    ProjectVersionConflictException,
+    WorkspaceQuotaExceededException,
+)
 
 
 class ProjectRepository(ABC):
@@ -21,8 +30,24 @@ class ProjectRepository(ABC):
     """
     
     @abstractmethod
-    def find_all(self) -> List[Project]:
-        """Retrieve all projects."""
+    def find_all(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        workspace_id: Optional[str] = None,
+    ) -> List[Project]:
+        """
+        Retrieve all projects, newest first.
+        
+        The optional bounds select the half-open range
+        ``created_after <= created_at < created_before``. Both bounds are
+        timezone-aware UTC datetimes. Database-backed adapters should serve
+        this with a range scan over an index on ``created_at``.
+        
+        When ``workspace_id`` is given, only that workspace's projects are
+        returned, and adapters must not scan other workspaces to find them
+        (e.g. an index on ``(workspace_id, created_at)``).
+        """
         pass
     
     @abstractmethod
@@ -30,11 +55,40 @@ class ProjectRepository(ABC):
         """Find a project by its ID."""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, project_ids: Iterable[UUID]) -> Dict[UUID, Project]:
+        """
+        Find several projects in one call.
+        
+        Returns a mapping of id to project for the ids that exist; unknown
+        ids are simply absent. Database-backed adapters should serve this
+        with a single ``WHERE id IN (...)`` query.
+        """
+        pass
+    
     @abstractmethod
     def save(self, project: Project) -> Project:
         """Save a new project or update an existing one."""
         pass
     
+    @abstractmethod
+    def save_if_version(self, project: Project, expected_version: int) -> Project:
+        """
+        Update a stored project only if it is still at ``expected_version``.
+        
+        This is a compare-and-swap: the version check and the write happen
+        atomically, and a successful write sets ``project.version`` to
+        ``expected_version + 1``. Database-backed adapters should issue
+        ``UPDATE ... SET ..., version = version + 1 WHERE id = ? AND
+        version = ?`` and treat zero affected rows as a conflict (or as a
+        missing project, if the id no longer exists).
+        
+        Raises:
+            ProjectNotFoundException: If the project is not stored.
+            ProjectVersionConflictException: If the stored version differs.
+        """
+        pass
+    
     @abstractmethod
     def delete(self, project_id: UUID) -> None:
         """Delete a project by its ID."""
@@ -44,6 +98,25 @@ class ProjectRepository(ABC):
     def exists(self, project_id: UUID) -> bool:
         """Check if a project exists."""
         pass
+    
+    def close(self) -> None:
+        """Release resources held by the adapter (files, connections) at shutdown."""
+        pass
+
+
+class _WorkspacePartition:
+    """Storage and ordering index for the projects of one workspace."""
+    
+    __slots__ = ("projects", "created_index", "sizes", "bytes_used")
+    
+    def __init__(self):
+        self.projects: dict[UUID, Project] = {}
+        # (created_at, id) pairs kept in ascending order so listings and
+        # created_at range queries are answered by bisection instead of a sort.
+        self.created_index: list[tuple[datetime, UUID]] = []
+        # Estimated bytes per resident project, and their sum for quotas
+        self.sizes: dict[UUID, int] = {}
+        self.bytes_used = 0
 
 
 class InMemoryProjectRepository(ProjectRepository):
@@ -52,41 +125,240 @@ class InMemoryProjectRepository(ProjectRepository):
     
     Simple implementation for demonstration. In production, this would
     be replaced with a database-backed repository (e.g., SQLAlchemy).
+    
+    Projects are partitioned by workspace: each workspace has its own dict
+    and created_at index, so a workspace-scoped query never touches another
+    workspace's data. An optional per-workspace quota caps the estimated
+    memory held by each partition.
     """
     
-    def __init__(self):
-        self._projects: dict[UUID, Project] = {}
-    
-    def find_all(self) -> List[Project]:
-        """Return all projects sorted by creation date."""
-        return sorted(
-            self._projects.values(),
-            key=lambda p: p.created_at,
-            reverse=True
-        )
+    # Rough per-project overhead (entity, dict slots, index entry) on top of
+    # its text fields, used for quota accounting
+    PROJECT_OVERHEAD_BYTES = 600
+    
+    def __init__(self, max_workspace_bytes: Optional[int] = None):
+        self._partitions: dict[str, _WorkspacePartition] = {}
+        self._workspace_of: dict[UUID, str] = {}
+        self._max_workspace_bytes = max_workspace_bytes
+        # Guards partitions and the id -> workspace map together; request
+        # threads and background job workers write concurrently.
+        self._lock = threading.Lock()
+    
+    def find_all(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        workspace_id: Optional[str] = None,
+    ) -> List[Project]:
+        """Return projects sorted by creation date, newest first."""
+        with self._lock:
+            if workspace_id is not None:
+                partition = self._partitions.get(workspace_id)
+                if partition is None:
+                    return []
+                entries = self._range(partition, created_after, created_before)
+                listed = [project_id for _, project_id in reversed(entries)]
+                projects = [partition.projects.get(project_id) for project_id in listed]
+            
+            elif len(self._partitions) == 1:
+                partition = next(iter(self._partitions.values()))
+                entries = self._range(partition, created_after, created_before)
+                listed = [project_id for _, project_id in reversed(entries)]
+                projects = [partition.projects.get(project_id) for project_id in listed]
+            
+            else:
+                # Across workspaces: merge the per-partition ranges, already sorted
+                ranges = [
+                    [(entry, partition) for entry in self._range(partition, created_after, created_before)]
+                    for partition in self._partitions.values()
+                ]
+                merged = list(heapq.merge(*ranges, key=lambda item: item[0]))
+                listed = [entry[1] for entry, _ in reversed(merged)]
+                projects = [partition.projects.get(entry[1]) for entry, partition in reversed(merged)]
+        
+        return self._load_unresident(listed, projects)
     
     def find_by_id(self, project_id: UUID) -> Optional[Project]:
         """Find project by ID, return None if not found."""
-        return self._projects.get(project_id)
+        workspace_id = self._workspace_of.get(project_id)
+        if workspace_id is None:
+            return None
+        partition = self._partitions.get(workspace_id)
+        return self._get(partition, project_id) if partition is not None else None
+    
+    def find_by_ids(self, project_ids: Iterable[UUID]) -> Dict[UUID, Project]:
+        """Find the projects with the given IDs in a single pass."""
+        found = {}
+        for project_id in project_ids:
+            project = self.find_by_id(project_id)
+            if project is not None:
+                found[project_id] = project
+        return found
     
     def save(self, project: Project) -> Project:
         """
         Save a project. If it already exists, update it.
         In a real implementation, this might be split into separate
         create/update methods.
+        
+        Raises:
+            WorkspaceQuotaExceededException: If the write would take the
+                project's workspace over its quota.
+            ValueError: If the project is already stored in another workspace.
+        """
+        with self._lock:
+            self._put(project)
+        return project
+    
+    def save_if_version(self, project: Project, expected_version: int) -> Project:
         """
-        self._projects[project.id] = project
+        Compare the stored version and write under the same lock acquisition.
+        
+        Raises:
+            ProjectNotFoundException: If the project is not stored.
+            ProjectVersionConflictException: If the stored version differs.
+            WorkspaceQuotaExceededException: If the write would take the
+                project's workspace over its quota.
+            ValueError: If the project is already stored in another workspace.
+        """
+        with self._lock:
+            workspace_id = self._workspace_of.get(project.id)
+            if workspace_id is None:
+                raise ProjectNotFoundException(str(project.id))
+            
+            current = self._get(self._partitions[workspace_id], project.id)
+            if current.version != expected_version:
+                raise ProjectVersionConflictException(
+                    str(project.id), [expected_version], current.version
+                )
+            
+            project.version = expected_version + 1
+            try:
+                self._put(project)
+            except (WorkspaceQuotaExceededException, ValueError):
+                project.version = expected_version
+                raise
         return project
     
     def delete(self, project_id: UUID) -> None:
         """
         Delete a project. Raises ProjectNotFoundException if not found.
         """
-        if project_id not in self._projects:
-            raise ProjectNotFoundException(str(project_id))
-        
-        del self._projects[project_id]
+        with self._lock:
+            workspace_id = self._workspace_of.pop(project_id, None)
+            if workspace_id is None:
+                raise ProjectNotFoundException(str(project_id))
+            
+            partition = self._partitions[workspace_id]
+            project = self._take(partition, project_id)
+            self._release(partition, project_id)
+            self._remove_from_index(partition, project)
+            if not partition.created_index:
+                del self._partitions[workspace_id]
     
     def exists(self, project_id: UUID) -> bool:
         """Check if a project with given ID exists."""
-        return project_id in self._projects
+        return project_id in self._workspace_of
+    
+    def workspace_usage(self, workspace_id: str) -> int:
+        """Estimated bytes held in memory for a workspace."""
+        partition = self._partitions.get(workspace_id)
+        return partition.bytes_used if partition is not None else 0
+    
+    def _put(self, project: Project) -> None:
+        """Store a project in its workspace's partition. Caller holds the lock."""
+        current_workspace = self._workspace_of.get(project.id)
+        if current_workspace is not None and current_workspace != project.workspace_id:
+            raise ValueError("Project cannot move between workspaces")
+        
+        # A new workspace's partition is only registered once the quota
+        # check passes, so rejected writes leave nothing behind
+        partition = self._partitions.get(project.workspace_id) or _WorkspacePartition()
+        self._charge(partition, project)
+        self._partitions[project.workspace_id] = partition
+        # Overwrite in place: readers don't take the lock, so the id must
+        # never be missing from storage while it is being updated
+        existing = self._get(partition, project.id)
+        if existing is None:
+            insort(partition.created_index, (project.created_at, project.id))
+        elif existing.created_at != project.created_at:
+            self._remove_from_index(partition, existing)
+            insort(partition.created_index, (project.created_at, project.id))
+        
+        partition.projects[project.id] = project
+        self._workspace_of[project.id] = project.workspace_id
+        self._stored(project.id)
+    
+    def _load_unresident(
+        self, project_ids: List[UUID], projects: List[Optional[Project]]
+    ) -> List[Project]:
+        """
+        Fill in listed projects that are not held in memory.
+        
+        ``projects`` holds the in-memory instance for each id in
+        ``project_ids``, or None. Called without the lock, so subclasses can
+        load from slower storage without blocking writers. Everything is
+        in memory here, so nothing is missing.
+        """
+        return projects
+    
+    def _get(self, partition: _WorkspacePartition, project_id: UUID) -> Optional[Project]:
+        """Look up a project stored in a partition."""
+        return partition.projects.get(project_id)
+    
+    def _stored(self, project_id: UUID) -> None:
+        """
+        Hook run once a project is in a partition's storage, for subclasses
+        that keep other copies. Caller holds the lock.
+        """
+        pass
+    
+    def _take(self, partition: _WorkspacePartition, project_id: UUID) -> Optional[Project]:
+        """
+        Detach a project from a partition's storage and return it.
+        Caller holds the lock and keeps the index consistent.
+        """
+        return partition.projects.pop(project_id, None)
+    
+    def _charge(self, partition: _WorkspacePartition, project: Project) -> None:
+        """
+        Account for a project's estimated size, enforcing the quota on growth.
+        Caller holds the lock.
+        """
+        size = (
+            self.PROJECT_OVERHEAD_BYTES
+            + len(project.name.encode("utf-8"))
+            + len(project.description.encode("utf-8"))
+        )
+        previous = partition.sizes.get(project.id, 0)
+        if (
+            self._max_workspace_bytes is not None
+            and size > previous
+            and partition.bytes_used - previous + size > self._max_workspace_bytes
+        ):
+            raise WorkspaceQuotaExceededException(project.workspace_id, self._max_workspace_bytes)
+        
+        partition.sizes[project.id] = size
+        partition.bytes_used += size - previous
+    
+    def _release(self, partition: _WorkspacePartition, project_id: UUID) -> None:
+        """Stop accounting for a project's size. Caller holds the lock."""
+        partition.bytes_used -= partition.sizes.pop(project_id, 0)
+    
+    @staticmethod
+    def _range(
+        partition: _WorkspacePartition,
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+    ) -> list[tuple[datetime, UUID]]:
+        """Index entries of a partition within the created_at bounds, ascending."""
+        index = partition.created_index
+        start = 0 if created_after is None else bisect_left(index, (created_after,))
+        end = len(index) if created_before is None else bisect_left(index, (created_before,))
+        return index[start:end]
+    
+    @staticmethod
+    def _remove_from_index(partition: _WorkspacePartition, project: Project) -> None:
+        """Drop a project's entry from a partition's created_at index. Caller holds the lock."""
+        position = bisect_left(partition.created_index, (project.created_at, project.id))
+        del partition.created_index[position]
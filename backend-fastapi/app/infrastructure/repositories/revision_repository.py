@@ -0,0 +1,270 @@
+"""
+Revision repository - Infrastructure layer.
+
+Defines the project revision history interface (port) and provides an
+in-memory implementation storing field-level deltas with periodic
+full-state checkpoints.
+"""
+import threading
+from array import array
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from app.domain.entities import ProjectRevision
+
+
+class RevisionRepository(ABC):
+    """
+    Abstract revision history interface (Port).
+
+    Revisions of a project are numbered from 0. Revision 0 is the base
+    state the project had before its first recorded change.
+
+    Each change is keyed by the project version it produced, and the
+    history is kept in version order whatever order changes are recorded
+    in, so concurrent updates cannot leave it out of step with the stored
+    project.
+    """
+
+    @abstractmethod
+    def record_change(
+        self,
+        project_id: UUID,
+        previous_state: Dict[str, Any],
+        changes: Dict[str, Any],
+        changed_at: datetime,
+        created_at: datetime,
+        version: int,
+    ) -> ProjectRevision:
+        """
+        Add a change to a project's history at its version's position.
+
+        Args:
+            project_id: The project that changed.
+            previous_state: Full editable state at ``version - 1``; stored as
+                revision 0 (at ``created_at``) if no earlier version is known.
+            changes: The fields that changed, with their new values.
+            changed_at: When the change happened.
+            created_at: When the project was created.
+            version: The project version the change produced.
+
+        Returns:
+            The recorded revision.
+
+        Raises:
+            ValueError: If a change for ``version`` is already recorded.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_project(self, project_id: UUID) -> List[ProjectRevision]:
+        """Retrieve a project's revisions, oldest first."""
+        pass
+
+    @abstractmethod
+    def find_state_as_of(self, project_id: UUID, as_of: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild a project's editable state at a point in time.
+
+        Returns None if the project has no history, or if ``as_of`` is
+        before its base revision.
+        """
+        pass
+
+    @abstractmethod
+    def delete_by_project(self, project_id: UUID) -> None:
+        """Forget a project's history."""
+        pass
+
+
+class _History:
+    """Compact per-project revision storage."""
+
+    __slots__ = ("versions", "timestamps", "deltas", "checkpoints")
+
+    def __init__(self):
+        # Project version after each revision, ascending; packed as int64
+        self.versions: array = array("q")
+        # POSIX timestamps, ascending; floats are smaller than datetimes
+        self.timestamps: list[float] = []
+        # Changed fields per revision as (field, value) pairs
+        self.deltas: list[tuple] = []
+        # Full state as (field, value) pairs for every checkpoint_interval-th revision
+        self.checkpoints: list[tuple] = []
+
+
+class InMemoryRevisionRepository(RevisionRepository):
+    """
+    In-memory implementation of RevisionRepository.
+
+    Each revision stores only its changed fields. Every
+    ``checkpoint_interval``-th revision also stores the full state, so
+    rebuilding any past state replays fewer than ``checkpoint_interval``
+    deltas. Unchanged field values are shared with the live entity rather
+    than copied, so checkpoints cost little beyond their container.
+    """
+
+    def __init__(self, checkpoint_interval: int = 32):
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1")
+        self._checkpoint_interval = checkpoint_interval
+        self._histories: dict[UUID, _History] = {}
+        self._lock = threading.Lock()
+
+    def record_change(
+        self,
+        project_id: UUID,
+        previous_state: Dict[str, Any],
+        changes: Dict[str, Any],
+        changed_at: datetime,
+        created_at: datetime,
+        version: int,
+    ) -> ProjectRevision:
+        """
+        Append a delta, writing a checkpoint when one is due.
+
+        A change that arrives after a later version was recorded is spliced
+        into place instead, re-encoding the project's history.
+        """
+        with self._lock:
+            history = self._histories.get(project_id)
+            if history is None:
+                history = self._histories[project_id] = _History()
+                self._append(history, version - 1, created_at, previous_state, previous_state)
+
+            if version <= history.versions[-1]:
+                number = self._splice(history, previous_state, changes, changed_at, created_at, version)
+                return self._revision(history, number)
+
+            # Diff against the last stored state rather than trusting
+            # ``changes``: they differ while an earlier version is in flight.
+            last = self._replay(history, len(history.deltas) - 1)
+            state = {**previous_state, **changes}
+            delta = {field: value for field, value in state.items() if last.get(field) != value}
+            self._append(
+                history,
+                version,
+                changed_at,
+                delta,
+                state if len(history.deltas) % self._checkpoint_interval == 0 else None,
+            )
+            return self._revision(history, len(history.deltas) - 1)
+
+    def find_by_project(self, project_id: UUID) -> List[ProjectRevision]:
+        """Return a project's revisions, oldest first."""
+        with self._lock:
+            history = self._histories.get(project_id)
+            if history is None:
+                return []
+            return [self._revision(history, number) for number in range(len(history.deltas))]
+
+    def find_state_as_of(self, project_id: UUID, as_of: datetime) -> Optional[Dict[str, Any]]:
+        """Bisect to the revision in effect at ``as_of`` and replay from its checkpoint."""
+        with self._lock:
+            history = self._histories.get(project_id)
+            if history is None:
+                return None
+
+            number = bisect_right(history.timestamps, as_of.timestamp()) - 1
+            if number < 0:
+                return None
+            return self._replay(history, number)
+
+    def delete_by_project(self, project_id: UUID) -> None:
+        """Forget a project's history."""
+        with self._lock:
+            self._histories.pop(project_id, None)
+
+    def _splice(
+        self,
+        history: _History,
+        previous_state: Dict[str, Any],
+        changes: Dict[str, Any],
+        changed_at: datetime,
+        created_at: datetime,
+        version: int,
+    ) -> int:
+        """
+        Insert a late change by version and re-encode the history.
+        Returns the new revision's number. Caller holds the lock.
+        """
+        states = []
+        state: Dict[str, Any] = {}
+        for delta in history.deltas:
+            state = {**state, **dict(delta)}
+            states.append(state)
+        entries = list(zip(history.versions, history.timestamps, states))
+
+        position = bisect_left(history.versions, version)
+        entry = (version, changed_at.timestamp(), {**previous_state, **changes})
+        if position == 0:
+            # The base was inferred from a later change's previous state;
+            # this change is older, so its previous state becomes the base.
+            entries[0:1] = [(version - 1, created_at.timestamp(), dict(previous_state)), entry]
+            position = 1
+        elif history.versions[position] == version:
+            raise ValueError(f"A revision for version {version} is already recorded")
+        else:
+            entries.insert(position, entry)
+
+        # Keep the late change's timestamp between its neighbours'
+        timestamp = max(entry[1], entries[position - 1][1])
+        if position + 1 < len(entries):
+            timestamp = min(timestamp, entries[position + 1][1])
+        entries[position] = (version, timestamp, entry[2])
+
+        history.versions, history.timestamps = array("q"), []
+        history.deltas, history.checkpoints = [], []
+        previous: Dict[str, Any] = {}
+        for number, (entry_version, entry_timestamp, state) in enumerate(entries):
+            delta = {field: value for field, value in state.items() if previous.get(field) != value}
+            history.versions.append(entry_version)
+            history.timestamps.append(entry_timestamp)
+            history.deltas.append(tuple(delta.items()))
+            if number % self._checkpoint_interval == 0:
+                history.checkpoints.append(tuple(state.items()))
+            previous = state
+        return position
+
+    def _append(
+        self,
+        history: _History,
+        version: int,
+        changed_at: datetime,
+        changes: Dict[str, Any],
+        state: Optional[Dict[str, Any]],
+    ) -> None:
+        """Store one revision. Caller holds the lock."""
+        timestamp = changed_at.timestamp()
+        if history.timestamps and timestamp < history.timestamps[-1]:
+            # Keep timestamps sorted for bisection even if the clock steps back
+            timestamp = history.timestamps[-1]
+        history.versions.append(version)
+        history.timestamps.append(timestamp)
+        history.deltas.append(tuple(changes.items()))
+        if state is not None:
+            history.checkpoints.append(tuple(state.items()))
+
+    def _replay(self, history: _History, number: int) -> Dict[str, Any]:
+        """Rebuild the state after revision ``number``. Caller holds the lock."""
+        checkpoint = number // self._checkpoint_interval
+        state = dict(history.checkpoints[checkpoint])
+        for delta in history.deltas[checkpoint * self._checkpoint_interval + 1:number + 1]:
+            state.update(delta)
+        return state
+
+    def _revision(self, history: _History, number: int) -> ProjectRevision:
+        """Materialize a stored revision. Caller holds the lock."""
+        state = None
+        if number % self._checkpoint_interval == 0:
+            state = dict(history.checkpoints[number // self._checkpoint_interval])
+        return ProjectRevision(
+            number=number,
+            version=history.versions[number],
+            changed_at=datetime.fromtimestamp(history.timestamps[number], tz=timezone.utc),
+            changes=dict(history.deltas[number]),
+            state=state,
+        )
@@ -0,0 +1,144 @@
+"""
+Task repository - Infrastructure layer.
+
+Defines the task repository interface (port) and provides an in-memory
+implementation that maintains per-project progress rollups.
+"""
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from app.domain.entities import Task, TaskRollup, TaskStatus
+from app.domain.exceptions import TaskNotFoundException
+
+
+class TaskRepository(ABC):
+    """
+    Abstract task repository interface (Port).
+
+    Besides task persistence, adapters expose per-project rollups. These
+    must be answerable for many projects in one call, so a page of
+    projects never needs one query per project.
+    """
+
+    @abstractmethod
+    def find_by_project(self, project_id: UUID) -> List[Task]:
+        """Retrieve a project's tasks in creation order."""
+        pass
+
+    @abstractmethod
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        """Find a task by its ID."""
+        pass
+
+    @abstractmethod
+    def save(self, task: Task) -> Task:
+        """Save a new task or update an existing one."""
+        pass
+
+    @abstractmethod
+    def delete(self, task_id: UUID) -> None:
+        """Delete a task by its ID."""
+        pass
+
+    @abstractmethod
+    def delete_by_project(self, project_id: UUID) -> int:
+        """Delete all tasks of a project. Returns the number deleted."""
+        pass
+
+    @abstractmethod
+    def get_rollups(self, project_ids: Iterable[UUID]) -> Dict[UUID, TaskRollup]:
+        """
+        Get task rollups for several projects in one call.
+
+        Every requested id is present in the result; projects without
+        tasks get an empty rollup. Database-backed adapters should keep
+        a per-project counter table updated with task writes, or at least
+        serve this with a single grouped query.
+        """
+        pass
+
+
+class InMemoryTaskRepository(TaskRepository):
+    """
+    In-memory implementation of TaskRepository.
+
+    Tasks are grouped per project, and each project's rollup counters are
+    adjusted on every save and delete, so rollups cost a dict lookup.
+    """
+
+    def __init__(self):
+        self._tasks: dict[UUID, Task] = {}
+        # project id -> task id -> task, in insertion (creation) order
+        self._by_project: dict[UUID, dict[UUID, Task]] = {}
+        # project id -> [total, done]
+        self._rollups: dict[UUID, list[int]] = {}
+        # IDs of tasks last saved as DONE. Tracked separately from the task
+        # objects because callers mutate a stored task before saving it.
+        self._done_ids: set[UUID] = set()
+        self._lock = threading.Lock()
+
+    def find_by_project(self, project_id: UUID) -> List[Task]:
+        """Return a project's tasks in creation order."""
+        with self._lock:
+            return list(self._by_project.get(project_id, {}).values())
+
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        """Find task by ID, return None if not found."""
+        return self._tasks.get(task_id)
+
+    def save(self, task: Task) -> Task:
+        """Save a task, adjusting its project's rollup counters."""
+        with self._lock:
+            counters = self._rollups.setdefault(task.project_id, [0, 0])
+            if task.id not in self._tasks:
+                counters[0] += 1
+
+            was_done = task.id in self._done_ids
+            is_done = task.status == TaskStatus.DONE
+            if is_done and not was_done:
+                self._done_ids.add(task.id)
+                counters[1] += 1
+            elif was_done and not is_done:
+                self._done_ids.discard(task.id)
+                counters[1] -= 1
+
+            self._tasks[task.id] = task
+            self._by_project.setdefault(task.project_id, {})[task.id] = task
+        return task
+
+    def delete(self, task_id: UUID) -> None:
+        """
+        Delete a task. Raises TaskNotFoundException if not found.
+        """
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                raise TaskNotFoundException(str(task_id))
+
+            del self._by_project[task.project_id][task_id]
+            counters = self._rollups[task.project_id]
+            counters[0] -= 1
+            if task_id in self._done_ids:
+                self._done_ids.discard(task_id)
+                counters[1] -= 1
+
+    def delete_by_project(self, project_id: UUID) -> int:
+        """Delete all tasks of a project."""
+        with self._lock:
+            tasks = self._by_project.pop(project_id, {})
+            self._rollups.pop(project_id, None)
+            for task_id in tasks:
+                del self._tasks[task_id]
+                self._done_ids.discard(task_id)
+            return len(tasks)
+
+    def get_rollups(self, project_ids: Iterable[UUID]) -> Dict[UUID, TaskRollup]:
+        """Read the maintained rollup counters for the given projects."""
+        rollups = self._rollups
+        result = {}
+        for project_id in project_ids:
+            counters = rollups.get(project_id)
+            result[project_id] = TaskRollup(*counters) if counters else TaskRollup()
+        return result
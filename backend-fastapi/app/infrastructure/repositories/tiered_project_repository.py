@@ -0,0 +1,213 @@
+"""
+Tiered project repository - Infrastructure layer.
+
+Keeps active projects in memory and moves old DONE projects to a
+compressed on-disk segment, loading them back transparently on reads.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.entities import Project, ProjectStatus, utc_now
+from app.infrastructure.repositories.cold_segment import ColdSegmentStore
+from app.infrastructure.repositories.project_repository import (
+    InMemoryProjectRepository,
+    _WorkspacePartition,
+)
+
+
+class TieredProjectRepository(InMemoryProjectRepository):
+    """
+    Two-tier implementation of ProjectRepository.
+
+    PLANNED and IN_PROGRESS projects, and recently created DONE projects,
+    live in the hot in-memory partitions inherited from
+    InMemoryProjectRepository. DONE projects older than ``cold_after`` are
+    moved to a ColdSegmentStore by a demotion sweep that runs on a
+    background thread every ``sweep_every`` writes (or on demand via
+    ``demote_cold_projects``).
+    Each workspace's created_at index covers both tiers, so listings and
+    range queries keep their ordering, and cold projects no longer count
+    towards their workspace's memory quota.
+
+    Cold projects returned by reads are detached copies; saving one moves
+    it back to the hot tier.
+    """
+
+    # Demoted projects moved per lock acquisition during a sweep
+    SWEEP_BATCH = 500
+
+    def __init__(
+        self,
+        segment_dir: Optional[str] = None,
+        cold_after: timedelta = timedelta(days=30),
+        sweep_every: int = 1000,
+        max_workspace_bytes: Optional[int] = None,
+    ):
+        super().__init__(max_workspace_bytes=max_workspace_bytes)
+        self._cold = ColdSegmentStore(segment_dir)
+        self._cold_after = cold_after
+        self._sweep_every = sweep_every
+        self._writes_since_sweep = 0
+        self._sweeper: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def hot_count(self) -> int:
+        """Number of projects held in memory."""
+        return sum(len(partition.projects) for partition in self._partitions.values())
+
+    @property
+    def cold_count(self) -> int:
+        """Number of projects held in the cold segment."""
+        return len(self._cold)
+
+    def close(self) -> None:
+        """
+        Wait for a running demotion sweep, then delete the cold segment
+        file; cold projects are lost.
+        """
+        with self._lock:
+            self._closed = True
+            sweeper = self._sweeper
+        if sweeper is not None:
+            sweeper.join()
+        self._cold.close()
+
+    def save(self, project: Project) -> Project:
+        """
+        Save a project to the hot tier, moving it out of the cold tier if needed.
+        """
+        saved = super().save(project)
+        self._count_write()
+        return saved
+
+    def save_if_version(self, project: Project, expected_version: int) -> Project:
+        """
+        Conditionally save a project to the hot tier, moving it out of the
+        cold tier if needed.
+        """
+        saved = super().save_if_version(project, expected_version)
+        self._count_write()
+        return saved
+
+    def demote_cold_projects(self, now: Optional[datetime] = None) -> int:
+        """
+        Move DONE projects older than the threshold to the cold tier.
+
+        Candidates are picked under the lock but compressed outside it, then
+        moved in batches of ``SWEEP_BATCH``, so writers are only held up for
+        short stretches. A candidate saved or deleted in between stays where
+        it is.
+
+        Args:
+            now: Reference time for the age threshold (defaults to the current time).
+
+        Returns:
+            The number of projects moved.
+        """
+        cutoff = (now or utc_now()) - self._cold_after
+
+        with self._lock:
+            candidates = [
+                (project, project.version)
+                for partition in self._partitions.values()
+                for project in partition.projects.values()
+                if project.status == ProjectStatus.DONE and project.created_at < cutoff
+            ]
+        if not candidates:
+            return 0
+
+        blocks = self._cold.encode(project for project, _ in candidates)
+        moved = 0
+
+        for start in range(0, len(candidates), self.SWEEP_BATCH):
+            batch = zip(
+                candidates[start:start + self.SWEEP_BATCH],
+                blocks[start:start + self.SWEEP_BATCH],
+            )
+            with self._lock:
+                demoted = []
+                for (project, version), block in batch:
+                    partition = self._partitions.get(project.workspace_id)
+                    # Saves store a new object or bump the version, so an
+                    # untouched candidate is still the stored one at the same version
+                    if (
+                        partition is not None
+                        and partition.projects.get(project.id) is project
+                        and project.version == version
+                    ):
+                        demoted.append((partition, project, block))
+
+                # Written to the cold tier before leaving the hot one, so
+                # lock-free readers always find the project in one of them
+                self._cold.append_encoded(block for _, _, block in demoted)
+                for partition, project, _ in demoted:
+                    del partition.projects[project.id]
+                    self._release(partition, project.id)
+                moved += len(demoted)
+
+        return moved
+
+    def _count_write(self) -> None:
+        """Start a background demotion sweep once every ``sweep_every`` writes."""
+        self._writes_since_sweep += 1
+        if self._writes_since_sweep < self._sweep_every:
+            return
+
+        with self._lock:
+            self._writes_since_sweep = 0
+            if self._closed or (self._sweeper is not None and self._sweeper.is_alive()):
+                return
+            self._sweeper = threading.Thread(
+                target=self.demote_cold_projects, name="cold-sweep", daemon=True
+            )
+            self._sweeper.start()
+
+    def _load_unresident(
+        self, project_ids: List[UUID], projects: List[Optional[Project]]
+    ) -> List[Project]:
+        """
+        Read the listed cold projects outside the lock, in segment order.
+
+        A project promoted or deleted since the listing was taken is looked
+        up again, and dropped if it no longer exists.
+        """
+        missing = [project_id for project_id, project in zip(project_ids, projects) if project is None]
+        if not missing:
+            return projects
+
+        loaded = self._cold.read_many(missing)
+        result = []
+        for project_id, project in zip(project_ids, projects):
+            if project is None:
+                project = loaded.get(project_id) or self.find_by_id(project_id)
+                if project is None:
+                    continue
+            result.append(project)
+        return result
+
+    def _get(self, partition: _WorkspacePartition, project_id: UUID) -> Optional[Project]:
+        """Look up a project in the hot partition, then in the cold segment."""
+        project = partition.projects.get(project_id)
+        if project is None:
+            project = self._cold.read(project_id)
+            if project is None:
+                # Promoted to the hot tier between the two lookups
+                project = partition.projects.get(project_id)
+        return project
+
+    def _stored(self, project_id: UUID) -> None:
+        """Drop the cold copy of a project now held in the hot tier."""
+        if project_id in self._cold:
+            self._cold.remove(project_id)
+
+    def _take(self, partition: _WorkspacePartition, project_id: UUID) -> Optional[Project]:
+        """Detach a project from whichever tier holds it."""
+        project = partition.projects.pop(project_id, None)
+        if project is None:
+            project = self._cold.read(project_id)
+            if project is not None:
+                self._cold.remove(project_id)
+        return project
@@ -0,0 +1,46 @@
+"""
+Project seed loader - Infrastructure layer.
+
+Loads an initial set of projects from a JSON file so a freshly started
+instance can serve data without waiting for clients to recreate it.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from app.domain.entities import DEFAULT_WORKSPACE, Project, ProjectStatus
+from app.infrastructure.repositories.project_repository import ProjectRepository
+
+
+def load_seed_projects(repository: ProjectRepository, path: str) -> int:
+    """
+    Load projects from a JSON file into the repository.
+    
+    The file must contain a list of objects with ``name``, ``description``
+    and optionally ``status``, ``id``, ``created_at`` (ISO 8601) and
+    ``workspace_id``.
+    
+    Args:
+        repository: Repository to populate.
+        path: Path to the JSON seed file.
+        
+    Returns:
+        The number of projects loaded.
+        
+    Raises:
+        ValueError: If an entry fails domain validation.
+    """
+    records = json.loads(Path(path).read_text(encoding="utf-8"))
+    
+    for record in records:
+        repository.save(Project(
+            name=record["name"],
+            description=record["description"],
+            status=ProjectStatus(record.get("status", ProjectStatus.PLANNED)),
+            id=UUID(record["id"]) if record.get("id") else None,
+            created_at=datetime.fromisoformat(record["created_at"]) if record.get("created_at") else None,
+            workspace_id=record.get("workspace_id", DEFAULT_WORKSPACE),
+        ))
+    
+    return len(records)
@@ -4,48 +4,114 @@ FastAPI Application Entry Point.
 This module initializes and configures the FastAPI application,
 sets up middleware, and registers routers.
 """
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.core.config import settings
+from app.core.config import Settings, settings
+from app.core.container import Container
 from app.api.v1.projects_router import router as projects_router
-from app.schemas.project_schemas import HealthResponse
+from app.api.v1.jobs_router import router as jobs_router
+from app.api.v1.tasks_router import router as tasks_router
+from app.domain.entities import Project, ProjectStatus
+from app.schemas.project_schemas import HealthResponse, ProjectResponse
+
+
+def warm_up(container: Container) -> None:
+    """
+    Do the one-off work that would otherwise land on the first request.
+
+    Loads seed data and exercises the response serializers, so a cold
+    instance answers its first request as fast as a warm one. The container
+    has already built the adapters, and Starlette builds the middleware
+    stack on the lifespan call that runs this.
+    """
+    repository = container.repository
+    app_settings = container.settings
 
+    if app_settings.seed_data_path and not repository.find_all():
+        from app.infrastructure.seed.project_seed import load_seed_projects
 
-# Create FastAPI application instance
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="A showcase of hexagonal architecture with FastAPI",
-)
+        load_seed_projects(repository, app_settings.seed_data_path)
 
-# Configure CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    # Run a throwaway entity through the response models used by handlers
+    sample = Project(name="warm-up", description="warm-up", status=ProjectStatus.PLANNED)
+    ProjectResponse.model_validate(sample).model_dump_json()
+    HealthResponse(status="ok").model_dump_json()
 
 
-@app.get("/health", response_model=HealthResponse, tags=["health"])
-def health_check():
+def create_app(
+    app_settings: Settings = settings,
+    container: Optional[Container] = None,
+) -> FastAPI:
     """
-    Health check endpoint.
-    
-    Returns the service status. Useful for monitoring and container orchestration.
+    Build and configure a FastAPI application.
+
+    Args:
+        app_settings: Settings to configure the application with.
+        container: Prebuilt composition root, e.g. with test adapters.
+            Built from ``app_settings`` when omitted.
+
+    Returns:
+        The configured application. Warm-up runs during startup, before
+        the server accepts connections.
     """
-    return HealthResponse(status="ok")
+    container = container or Container(app_settings)
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if app_settings.warm_up_on_startup:
+            warm_up(container)
 
-# Register routers
-app.include_router(projects_router)
+        container.job_runner.start()
+        yield
+        container.job_runner.shutdown(timeout=app_settings.job_shutdown_timeout)
+        container.close()
+
+    app = FastAPI(
+        title=app_settings.app_name,
+        version=app_settings.app_version,
+        description="A showcase of hexagonal architecture with FastAPI",
+        lifespan=lifespan,
+    )
+    app.state.container = container
+
+    # Configure CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=app_settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.get("/health", response_model=HealthResponse, tags=["health"])
+    async def health_check():
+        """
+        Health check endpoint.
+
+        Returns the service status. Useful for monitoring and container orchestration.
+        Declared async since it never blocks, so it skips the threadpool.
+        """
+        return HealthResponse(status="ok")
+
+    # Register routers
+    app.include_router(projects_router)
+    app.include_router(tasks_router)
+    app.include_router(jobs_router)
+
+    return app
+
+
+# Application instance used by `uvicorn app.main:app`
+app = create_app()
 
 
 if __name__ == "__main__":
     import uvicorn
-    
+
     # Run the application
     # For development only - in production, use: uvicorn app.main:app
     uvicorn.run(
@@ -0,0 +1,38 @@
+"""
+Pydantic schemas for background job requests and responses.
+"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.application.jobs.job import JobStatus
+from app.schemas.project_schemas import ProjectCreateRequest
+
+
+class BulkDeleteJobRequest(BaseModel):
+    """Schema for submitting a bulk delete job."""
+    project_ids: List[UUID] = Field(..., min_length=1, max_length=100_000, description="Projects to delete")
+
+
+class BulkCreateJobRequest(BaseModel):
+    """Schema for submitting a bulk import job."""
+    projects: List[ProjectCreateRequest] = Field(..., min_length=1, max_length=100_000, description="Projects to create")
+
+
+class JobResponse(BaseModel):
+    """Schema for job status response."""
+    id: UUID = Field(..., description="Job unique identifier")
+    kind: str = Field(..., description="Job type")
+    status: JobStatus = Field(..., description="Job status")
+    total: int = Field(..., description="Number of items the job will process")
+    processed: int = Field(..., description="Number of items processed so far")
+    failed: int = Field(..., description="Number of items that failed")
+    errors: List[str] = Field(..., description="Error messages for failed items (truncated)")
+    created_at: datetime = Field(..., description="Submission timestamp")
+    started_at: Optional[datetime] = Field(None, description="Start timestamp")
+    finished_at: Optional[datetime] = Field(None, description="Completion timestamp")
+    
+    class Config:
+        from_attributes = True
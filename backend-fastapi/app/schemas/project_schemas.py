@@ -5,12 +5,17 @@ These act as DTOs (Data Transfer Objects) at the API boundary,
 separate from domain entities.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from app.domain.entities import ProjectStatus
+from app.domain.entities import DEFAULT_WORKSPACE, ProjectStatus
+from app.schemas.task_schemas import TaskRollupResponse
+
+
+# Workspace identifiers are short slugs
+WORKSPACE_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
 
 
 class ProjectBase(BaseModel):
@@ -23,6 +28,11 @@ class ProjectBase(BaseModel):
 class ProjectCreateRequest(ProjectBase):
     """Schema for creating a new project."""
     status: ProjectStatus = Field(default=ProjectStatus.PLANNED, description="Initial project status")
+    workspace_id: str = Field(
+        default=DEFAULT_WORKSPACE,
+        pattern=WORKSPACE_ID_PATTERN,
+        description="Workspace (tenant) the project belongs to",
+    )
 
 
 class ProjectUpdateRequest(BaseModel):
@@ -35,12 +45,40 @@ class ProjectUpdateRequest(BaseModel):
 class ProjectResponse(ProjectBase):
     """Schema for project response."""
     id: UUID = Field(..., description="Project unique identifier")
+    workspace_id: str = Field(..., description="Workspace (tenant) the project belongs to")
     created_at: datetime = Field(..., description="Project creation timestamp")
     
     class Config:
         from_attributes = True  # Allows creation from ORM models or dataclasses
 
 
+class ProjectListItemResponse(ProjectResponse):
+    """Schema for a project in a listing, optionally with its task rollup."""
+    task_rollup: Optional[TaskRollupResponse] = Field(
+        None, description="Task counts and completion, when requested"
+    )
+
+
+class ProjectRevisionResponse(BaseModel):
+    """Schema for a recorded project revision."""
+    revision: int = Field(..., description="Revision number, starting at 0 for the original state")
+    version: int = Field(..., description="Project version after this revision")
+    changed_at: datetime = Field(..., description="When the change was made")
+    changes: Dict[str, Any] = Field(..., description="Changed fields and their new values")
+    checkpoint: bool = Field(..., description="Whether the full state is stored at this revision")
+
+
+class ProjectBatchGetRequest(BaseModel):
+    """Schema for fetching several projects in one request."""
+    ids: List[UUID] = Field(..., min_length=1, max_length=500, description="Project identifiers to fetch")
+
+
+class ProjectBatchGetResponse(BaseModel):
+    """Schema for a batched project fetch."""
+    projects: List[ProjectResponse] = Field(..., description="Projects that were found, in request order")
+    missing_ids: List[UUID] = Field(..., description="Requested identifiers that do not exist")
+
+
 class HealthResponse(BaseModel):
     """Schema for health check response."""
     status: str = Field(..., description="Service health status")
@@ -0,0 +1,41 @@
+"""
+Pydantic schemas for task requests and responses.
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.domain.entities import TaskStatus
+
+
+class TaskCreateRequest(BaseModel):
+    """Schema for creating a new task."""
+    title: str = Field(..., min_length=1, max_length=200, description="Task title")
+    status: TaskStatus = Field(default=TaskStatus.TODO, description="Initial task status")
+
+
+class TaskUpdateRequest(BaseModel):
+    """Schema for updating an existing task. All fields are optional."""
+    title: Optional[str] = Field(None, min_length=1, max_length=200, description="New task title")
+    status: Optional[TaskStatus] = Field(None, description="New task status")
+
+
+class TaskResponse(BaseModel):
+    """Schema for task response."""
+    id: UUID = Field(..., description="Task unique identifier")
+    project_id: UUID = Field(..., description="Owning project identifier")
+    title: str = Field(..., description="Task title")
+    status: TaskStatus = Field(..., description="Task status")
+    created_at: datetime = Field(..., description="Task creation timestamp")
+    
+    class Config:
+        from_attributes = True
+
+
+class TaskRollupResponse(BaseModel):
+    """Schema for a project's aggregate task progress."""
+    total: int = Field(..., description="Number of tasks in the project")
+    done: int = Field(..., description="Number of DONE tasks")
+    percent_complete: float = Field(..., description="Share of DONE tasks, 0-100")
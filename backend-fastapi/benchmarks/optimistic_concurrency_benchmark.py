@@ -0,0 +1,136 @@
+"""
+Optimistic concurrency benchmark.
+
+Runs concurrent project updates from a pool of threads and compares two
+ways of keeping them from overwriting each other:
+
+- lock: one global lock held across read, edit and save, which is the
+  straightforward way to make read-modify-write safe;
+- cas: UpdateProjectUseCase, which edits a copy and saves it with
+  ``save_if_version``, retrying on conflict until the update lands.
+
+The repository sleeps for ``--latency-us`` on every call to stand in for a
+database round trip; without it, both variants are bound by the GIL and
+look alike. Contention is varied through the number of projects the
+updates are spread over: one project means every writer races for the
+same row.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.optimistic_concurrency_benchmark --threads 16
+"""
+import argparse
+import random
+import threading
+import time
+
+from app.application.use_cases.update_project import UpdateProjectUseCase
+from app.domain.entities import Project, ProjectStatus
+from app.domain.exceptions import ProjectVersionConflictException
+from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+
+
+class RemoteProjectRepository(InMemoryProjectRepository):
+    """In-memory repository that adds a fixed delay per call and counts conflicts."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.conflicts = 0
+
+    def find_by_id(self, project_id):
+        time.sleep(self.latency)
+        return super().find_by_id(project_id)
+
+    def save(self, project):
+        time.sleep(self.latency)
+        return super().save(project)
+
+    def save_if_version(self, project, expected_version):
+        time.sleep(self.latency)
+        try:
+            return super().save_if_version(project, expected_version)
+        except ProjectVersionConflictException:
+            self.conflicts += 1
+            raise
+
+
+def populate(repository: InMemoryProjectRepository, projects: int) -> list:
+    """Store the projects that updates are spread over."""
+    ids = []
+    for i in range(projects):
+        project = Project(name=f"Project {i}", description="0", status=ProjectStatus.PLANNED)
+        InMemoryProjectRepository.save(repository, project)
+        ids.append(project.id)
+    return ids
+
+
+def run(threads: int, updates: int, work) -> float:
+    """
+    Run ``updates`` calls of ``work(rng)`` on each thread and return the
+    elapsed seconds.
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(updates):
+            work(rng)
+
+    pool = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def locked(projects: int, threads: int, updates: int, latency: float) -> float:
+    """Throughput with a global lock around each read-modify-write."""
+    repository = RemoteProjectRepository(latency)
+    ids = populate(repository, projects)
+    lock = threading.Lock()
+
+    def update(rng: random.Random):
+        project_id = rng.choice(ids)
+        with lock:
+            project = repository.find_by_id(project_id).copy()
+            project.update(description=str(rng.random()))
+            repository.save(project)
+
+    return threads * updates / run(threads, updates, update)
+
+
+def optimistic(projects: int, threads: int, updates: int, latency: float) -> tuple[float, int]:
+    """Throughput and conflicts with versioned compare-and-swap saves."""
+    repository = RemoteProjectRepository(latency)
+    ids = populate(repository, projects)
+    use_case = UpdateProjectUseCase(repository)
+
+    def update(rng: random.Random):
+        use_case.execute(rng.choice(ids), description=str(rng.random()))
+
+    return threads * updates / run(threads, updates, update), repository.conflicts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--updates", type=int, default=200, help="updates per thread")
+    parser.add_argument("--latency-us", type=int, default=200, help="simulated round trip per repository call")
+    args = parser.parse_args()
+    latency = args.latency_us / 1_000_000
+
+    print(f"{args.threads} threads x {args.updates} updates, {args.latency_us} us per repository call")
+    print(f"{'projects':>10}{'lock (upd/s)':>16}{'cas (upd/s)':>16}{'cas retries':>14}")
+    total = args.threads * args.updates
+    for projects in (1, 10, 100, 10_000):
+        lock_rate = locked(projects, args.threads, args.updates, latency)
+        cas_rate, conflicts = optimistic(projects, args.threads, args.updates, latency)
+        print(f"{projects:>10}{lock_rate:>16.0f}{cas_rate:>16.0f}{conflicts / total:>13.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Per-request overhead benchmark.
+
+Drives the ASGI application directly (no HTTP server, no HTTP client) and
+reports the median time per request for ``GET /health`` and
+``GET /api/v1/projects/{id}``, i.e. routing, dependency resolution,
+handler and serialization cost.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.request_overhead_benchmark --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from app.main import create_app
+
+
+async def call(app, method: str, path: str, body: bytes = b"") -> tuple[int, bytes]:
+    """Send one request through the ASGI app and collect the response."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    status = 0
+    chunks = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+async def measure(app, path: str, requests: int) -> float:
+    """Median microseconds per request over ``requests`` sequential calls."""
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        status, _ = await call(app, "GET", path)
+        samples.append(time.perf_counter() - start)
+        assert status == 200, status
+    return statistics.median(samples) * 1e6
+
+
+async def run(requests: int) -> None:
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        status, body = await call(
+            app,
+            "POST",
+            "/api/v1/projects",
+            json.dumps({"name": "Bench", "description": "Benchmark project"}).encode(),
+        )
+        assert status == 201, status
+        project_id = json.loads(body)["id"]
+
+        # Warm the threadpool and any lazy paths before timing
+        await measure(app, "/health", 200)
+        await measure(app, f"/api/v1/projects/{project_id}", 200)
+
+        print(f"{'GET /health':<32}{await measure(app, '/health', requests):>10.1f} us/request")
+        print(f"{'GET /api/v1/projects/{id}':<32}{await measure(app, f'/api/v1/projects/{project_id}', requests):>10.1f} us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Cold-start benchmark.
+
+Measures, in fresh interpreter processes, how long it takes from importing
+``app.main`` to receiving the first ``GET /health`` response. Each run is
+split into import, startup (lifespan warm-up) and first-request time.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.startup_benchmark --runs 10 --budget-ms 1500
+
+Exits with status 1 when the median total exceeds ``--budget-ms`` so it
+can be used as a regression gate in CI.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in a fresh interpreter. The test client is imported before the clock
+# starts because it is not part of the production import path.
+CHILD_SCRIPT = """
+import json, time
+from fastapi.testclient import TestClient
+
+t0 = time.perf_counter()
+from app.main import app
+t1 = time.perf_counter()
+with TestClient(app) as client:
+    t2 = time.perf_counter()
+    response = client.get("/health")
+    t3 = time.perf_counter()
+assert response.status_code == 200
+print(json.dumps({"import": t1 - t0, "startup": t2 - t1, "first_request": t3 - t2}))
+"""
+
+
+def run_once() -> dict:
+    """Measure a single cold start in a new process."""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Number of cold starts to measure")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the median total exceeds this")
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+
+    print(f"{'phase':<15}{'median ms':>12}{'max ms':>12}")
+    for phase in ("import", "startup", "first_request"):
+        values = [s[phase] * 1000 for s in samples]
+        print(f"{phase:<15}{statistics.median(values):>12.1f}{max(values):>12.1f}")
+
+    totals = [sum(s.values()) * 1000 for s in samples]
+    median_total = statistics.median(totals)
+    print(f"{'total':<15}{median_total:>12.1f}{max(totals):>12.1f}")
+
+    if args.budget_ms is not None and median_total > args.budget_ms:
+        print(f"FAIL: median cold start {median_total:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Task rollup benchmark.
+
+Lists 1k projects with 100 tasks each and compares computing task counts
+and percent complete per project (the N+1 pattern) against reading the
+maintained rollups in one batched call, both at the repository level and
+end to end through ``GET /api/v1/projects?include_task_rollup=true``.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.task_rollup_benchmark --projects 1000 --tasks 100
+"""
+import argparse
+import random
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.container import Container
+from app.domain.entities import Project, ProjectStatus, Task, TaskRollup, TaskStatus
+from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+from app.infrastructure.repositories.task_repository import InMemoryTaskRepository
+from app.main import create_app
+
+
+def populate(projects: int, tasks: int):
+    """Build repositories with ``projects`` projects of ``tasks`` tasks each."""
+    rng = random.Random(42)
+    project_repository = InMemoryProjectRepository()
+    task_repository = InMemoryTaskRepository()
+    for i in range(projects):
+        project = project_repository.save(Project(
+            name=f"Project {i}",
+            description=f"Project {i} description",
+            status=ProjectStatus.IN_PROGRESS,
+        ))
+        for j in range(tasks):
+            task_repository.save(Task(
+                project_id=project.id,
+                title=f"Task {j}",
+                status=rng.choice(list(TaskStatus)),
+            ))
+    return project_repository, task_repository
+
+
+def rollups_per_project(project_repository, task_repository):
+    """Compute rollups with one task query per project (N+1)."""
+    result = {}
+    for project in project_repository.find_all():
+        tasks = task_repository.find_by_project(project.id)
+        result[project.id] = TaskRollup(
+            total=len(tasks),
+            done=sum(1 for t in tasks if t.status == TaskStatus.DONE),
+        )
+    return result
+
+
+def rollups_batched(project_repository, task_repository):
+    """Read maintained rollups for the whole list in one call."""
+    projects = project_repository.find_all()
+    return task_repository.get_rollups([p.id for p in projects])
+
+
+def median_ms(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    project_repository, task_repository = populate(args.projects, args.tasks)
+    print(f"{args.projects} projects x {args.tasks} tasks")
+    print(f"{'repository, N+1 (ms)':<34}{median_ms(lambda: rollups_per_project(project_repository, task_repository), args.runs):>10.2f}")
+    print(f"{'repository, batched (ms)':<34}{median_ms(lambda: rollups_batched(project_repository, task_repository), args.runs):>10.2f}")
+
+    container = Container(
+        Settings(), repository=project_repository, task_repository=task_repository
+    )
+    with TestClient(create_app(container=container)) as client:
+        plain = median_ms(lambda: client.get("/api/v1/projects"), args.runs)
+        with_rollup = median_ms(
+            lambda: client.get("/api/v1/projects", params={"include_task_rollup": True}),
+            args.runs,
+        )
+    print(f"{'GET /projects (ms)':<34}{plain:>10.2f}")
+    print(f"{'GET /projects + rollups (ms)':<34}{with_rollup:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
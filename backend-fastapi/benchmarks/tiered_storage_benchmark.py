@@ -0,0 +1,121 @@
+"""
+Tiered storage benchmark.
+
+Loads the same project set into InMemoryProjectRepository and
+TieredProjectRepository with a 90% cold mix (old DONE projects), then
+reports resident memory and find_by_id / range-listing latency per tier.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.tiered_storage_benchmark --projects 50000
+"""
+import argparse
+import gc
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.domain.entities import Project, ProjectStatus
+from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+from app.infrastructure.repositories.tiered_project_repository import TieredProjectRepository
+
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+WORDS = "plan build ship review deploy measure iterate design test refactor".split()
+
+
+def make_projects(count: int, cold_ratio: float, seed: int = 42) -> list[Project]:
+    """
+    Build projects where ``cold_ratio`` of them are DONE and a year old.
+
+    Output is deterministic for a given seed, ids included, so each
+    repository can be loaded from freshly allocated but identical data.
+    """
+    rng = random.Random(seed)
+    projects = []
+    for i in range(count):
+        cold = rng.random() < cold_ratio
+        projects.append(Project(
+            id=UUID(int=rng.getrandbits(128)),
+            name=f"Project {i}",
+            description=" ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 250))),
+            status=ProjectStatus.DONE if cold else rng.choice([ProjectStatus.PLANNED, ProjectStatus.IN_PROGRESS]),
+            created_at=NOW - timedelta(days=rng.randint(200, 400) if cold else rng.randint(0, 20)),
+        ))
+    return projects
+
+
+def measure_load(factory, count: int, cold_ratio: float):
+    """Return a populated repository and the memory it retains."""
+    gc.collect()
+    tracemalloc.start()
+    repository = factory()
+    # Generated inside the traced region so the repository owns its strings
+    projects = make_projects(count, cold_ratio)
+    for project in projects:
+        repository.save(project)
+    del projects
+    if isinstance(repository, TieredProjectRepository):
+        repository.demote_cold_projects(now=NOW)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return repository, retained
+
+
+def time_lookups(repository, ids, repeat: int = 1) -> float:
+    """Median find_by_id latency in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        for project_id in ids:
+            start = time.perf_counter()
+            repository.find_by_id(project_id)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def time_range(repository, days: int) -> float:
+    """Latency of a created_at window listing in milliseconds."""
+    start = time.perf_counter()
+    repository.find_all(created_after=NOW - timedelta(days=days))
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=50_000)
+    parser.add_argument("--cold-ratio", type=float, default=0.9)
+    parser.add_argument("--samples", type=int, default=2_000)
+    args = parser.parse_args()
+
+    projects = make_projects(args.projects, args.cold_ratio)
+    rng = random.Random(7)
+    hot_ids = [p.id for p in projects if p.status != ProjectStatus.DONE]
+    cold_ids = [p.id for p in projects if p.status == ProjectStatus.DONE]
+    hot_sample = rng.sample(hot_ids, min(args.samples, len(hot_ids)))
+    cold_sample = rng.sample(cold_ids, min(args.samples, len(cold_ids)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_repo, memory_bytes = measure_load(InMemoryProjectRepository, args.projects, args.cold_ratio)
+        tiered_repo, tiered_bytes = measure_load(
+            lambda: TieredProjectRepository(tmp, cold_after=timedelta(days=30), sweep_every=10**9),
+            args.projects,
+            args.cold_ratio,
+        )
+
+        print(f"{args.projects} projects, {len(cold_ids) / len(projects):.0%} cold")
+        print(f"{'':<28}{'in-memory':>14}{'tiered':>14}")
+        print(f"{'resident memory (MiB)':<28}{memory_bytes / 2**20:>14.1f}{tiered_bytes / 2**20:>14.1f}")
+        print(f"{'cold segment on disk (MiB)':<28}{'-':>14}{tiered_repo._cold.file_size / 2**20:>14.1f}")
+        print(f"{'find_by_id hot (us, p50)':<28}{time_lookups(memory_repo, hot_sample):>14.2f}{time_lookups(tiered_repo, hot_sample):>14.2f}")
+        print(f"{'find_by_id cold (us, p50)':<28}{time_lookups(memory_repo, cold_sample):>14.2f}{time_lookups(tiered_repo, cold_sample):>14.2f}")
+        print(f"{'list last 30 days (ms)':<28}{time_range(memory_repo, 30):>14.2f}{time_range(tiered_repo, 30):>14.2f}")
+        print(f"{'list everything (ms)':<28}{time_range(memory_repo, 1000):>14.2f}{time_range(tiered_repo, 1000):>14.2f}")
+        tiered_repo.close()
+
+
+if __name__ == "__main__":
+    main()
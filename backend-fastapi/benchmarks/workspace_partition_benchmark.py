@@ -0,0 +1,108 @@
+"""
+Workspace partitioning benchmark.
+
+Builds 1,000 workspaces of mixed sizes (a few large tenants, some medium
+ones and many small ones) and measures workspace-scoped listing latency
+per size class. The partitioned repository is compared with a single
+global dict that is filtered and sorted on every call, which is how
+listings worked before partitioning.
+
+Usage (from backend-fastapi/):
+    python -m benchmarks.workspace_partition_benchmark
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.domain.entities import Project, ProjectStatus
+from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def workspace_sizes(large: int, medium: int, small: int) -> dict[str, int]:
+    """Project count per workspace for each size class."""
+    rng = random.Random(42)
+    sizes = {}
+    for i in range(large):
+        sizes[f"large-{i}"] = 20_000
+    for i in range(medium):
+        sizes[f"medium-{i}"] = rng.randint(500, 2_000)
+    for i in range(small):
+        sizes[f"small-{i}"] = rng.randint(5, 50)
+    return sizes
+
+
+def build(sizes: dict[str, int]):
+    """Populate the partitioned repository and the flat baseline dict."""
+    rng = random.Random(7)
+    repository = InMemoryProjectRepository()
+    flat: dict = {}
+    for workspace, count in sizes.items():
+        for i in range(count):
+            project = Project(
+                name=f"{workspace} {i}",
+                description="Benchmark project",
+                status=ProjectStatus.IN_PROGRESS,
+                created_at=BASE + timedelta(seconds=rng.randint(0, 10**7)),
+                workspace_id=workspace,
+            )
+            repository.save(project)
+            flat[project.id] = project
+    return repository, flat
+
+
+def global_scan(flat: dict, workspace_id: str) -> list:
+    """Baseline: filter one global dict and sort on each call."""
+    return sorted(
+        (p for p in flat.values() if p.workspace_id == workspace_id),
+        key=lambda p: p.created_at,
+        reverse=True,
+    )
+
+
+def median_us(fn, workspaces: list[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        for workspace in workspaces:
+            start = time.perf_counter()
+            fn(workspace)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--large", type=int, default=5)
+    parser.add_argument("--medium", type=int, default=45)
+    parser.add_argument("--small", type=int, default=950)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    sizes = workspace_sizes(args.large, args.medium, args.small)
+    repository, flat = build(sizes)
+    small_only, _ = build({w: n for w, n in sizes.items() if w.startswith("small-")})
+
+    rng = random.Random(1)
+    classes = {
+        name: rng.sample([w for w in sizes if w.startswith(name)], min(args.samples, sum(w.startswith(name) for w in sizes)))
+        for name in ("small", "medium", "large")
+    }
+
+    print(f"{len(sizes)} workspaces, {len(flat)} projects")
+    print(f"{'tenant class':<14}{'partitioned us':>16}{'global scan us':>16}")
+    for name, workspaces in classes.items():
+        repeat = 5 if name != "large" else 1
+        partitioned = median_us(lambda w: repository.find_all(workspace_id=w), workspaces, repeat)
+        scanned = median_us(lambda w: global_scan(flat, w), workspaces, 1)
+        print(f"{name:<14}{partitioned:>16.1f}{scanned:>16.1f}")
+
+    alone = median_us(lambda w: small_only.find_all(workspace_id=w), classes["small"], 5)
+    print(f"{'small, no large neighbours':<30}{alone:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
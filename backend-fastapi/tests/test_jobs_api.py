@@ -0,0 +1,172 @@
+"""
+Tests for the background Jobs API.
+"""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from uuid import uuid4
+
+from app.core.config import Settings
+from app.core.container import Container
+from app.main import create_app
+from app.application.jobs.job import JobStatus
+from app.domain.exceptions import JobNotFoundException
+from app.infrastructure.jobs.job_runner import JobRunner
+from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+from app.infrastructure.repositories.revision_repository import InMemoryRevisionRepository
+from app.infrastructure.repositories.task_repository import InMemoryTaskRepository
+
+
+@pytest.fixture
+def runner():
+    """Create a single-worker job runner with a small queue."""
+    return JobRunner(workers=1, queue_size=2)
+
+
+@pytest.fixture
+def client(runner):
+    """Create a test client with fresh repositories and job runner."""
+    container = Container(
+        Settings(),
+        repository=InMemoryProjectRepository(),
+        task_repository=InMemoryTaskRepository(),
+        revision_repository=InMemoryRevisionRepository(),
+        job_runner=runner,
+    )
+    
+    with TestClient(create_app(container=container)) as test_client:
+        yield test_client
+
+
+def wait_for_job(client, job_id, timeout=5.0):
+    """Poll a job until it reaches a terminal state."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = client.get(f"/api/v1/jobs/{job_id}").json()
+        if data["status"] in ("SUCCEEDED", "FAILED", "CANCELLED"):
+            return data
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def block_worker(runner):
+    """Occupy the runner's only worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+    
+    def work(job):
+        started.set()
+        release.wait(5)
+    
+    runner.submit("blocker", 0, work)
+    assert started.wait(5)
+    return release
+
+
+def test_bulk_create_and_delete(client):
+    """Test importing projects and deleting them through jobs."""
+    projects = [{"name": f"Project {i}", "description": f"Description {i}"} for i in range(5)]
+    response = client.post("/api/v1/jobs/bulk-create", json={"projects": projects})
+    assert response.status_code == 202
+    assert response.json()["total"] == 5
+    
+    job = wait_for_job(client, response.json()["id"])
+    assert job["status"] == "SUCCEEDED"
+    assert job["processed"] == 5
+    
+    ids = [p["id"] for p in client.get("/api/v1/projects").json()]
+    assert len(ids) == 5
+    
+    fake_id = str(uuid4())
+    response = client.post("/api/v1/jobs/bulk-delete", json={"project_ids": ids + [fake_id]})
+    job = wait_for_job(client, response.json()["id"])
+    assert job["status"] == "SUCCEEDED"
+    assert job["processed"] == 6
+    assert job["failed"] == 1
+    assert fake_id in job["errors"][0]
+    assert client.get("/api/v1/projects").json() == []
+
+
+def test_cancel_queued_job(client, runner):
+    """Test that a cancelled job never runs."""
+    release = block_worker(runner)
+    
+    response = client.post("/api/v1/jobs/bulk-create", json={
+        "projects": [{"name": "Never", "description": "Should not be created"}],
+    })
+    job_id = response.json()["id"]
+    
+    response = client.post(f"/api/v1/jobs/{job_id}/cancel")
+    assert response.status_code == 202
+    assert response.json()["status"] == "CANCELLED"
+    job = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert job["status"] == "CANCELLED"
+    assert job["finished_at"] is not None
+    release.set()
+    
+    job = wait_for_job(client, job_id)
+    assert job["status"] == "CANCELLED"
+    assert job["processed"] == 0
+    assert client.get("/api/v1/projects").json() == []
+    
+    # Finished jobs cannot be cancelled again
+    response = client.post(f"/api/v1/jobs/{job_id}/cancel")
+    assert response.status_code == 409
+
+
+def test_submit_when_queue_full(client, runner):
+    """Test that submissions beyond the queue bound are rejected."""
+    release = block_worker(runner)
+    
+    payload = {"project_ids": [str(uuid4())]}
+    for _ in range(2):
+        assert client.post("/api/v1/jobs/bulk-delete", json=payload).status_code == 202
+    
+    response = client.post("/api/v1/jobs/bulk-delete", json=payload)
+    assert response.status_code == 503
+    release.set()
+
+
+def test_cancelled_job_frees_queue_slot(client, runner):
+    """Test that cancelling a queued job makes room for a new submission."""
+    release = block_worker(runner)
+    
+    payload = {"project_ids": [str(uuid4())]}
+    job_ids = [
+        client.post("/api/v1/jobs/bulk-delete", json=payload).json()["id"]
+        for _ in range(2)
+    ]
+    assert client.post("/api/v1/jobs/bulk-delete", json=payload).status_code == 503
+    
+    assert client.post(f"/api/v1/jobs/{job_ids[0]}/cancel").status_code == 202
+    response = client.post("/api/v1/jobs/bulk-delete", json=payload)
+    assert response.status_code == 202
+    release.set()
+    
+    assert wait_for_job(client, response.json()["id"])["status"] == "SUCCEEDED"
+    assert wait_for_job(client, job_ids[1])["status"] == "SUCCEEDED"
+    assert client.get(f"/api/v1/jobs/{job_ids[0]}").json()["status"] == "CANCELLED"
+
+
+def test_get_nonexistent_job(client):
+    """Test retrieving a job that doesn't exist."""
+    response = client.get(f"/api/v1/jobs/{uuid4()}")
+    assert response.status_code == 404
+
+
+def test_finished_job_history_is_capped():
+    """Test that only the most recent finished jobs are kept."""
+    runner = JobRunner(workers=1, queue_size=10, history_size=2)
+    jobs = [runner.submit("noop", 0, lambda job: None) for _ in range(5)]
+    deadline = time.monotonic() + 5
+    while not jobs[-1].is_finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Stopping the worker waits for it to finish pruning after the last job
+    runner.shutdown(timeout=5)
+    
+    for job in jobs[:3]:
+        with pytest.raises(JobNotFoundException):
+            runner.get(job.id)
+    assert [runner.get(job.id).status for job in jobs[3:]] == [JobStatus.SUCCEEDED] * 2
@@ -3,27 +3,48 @@ Tests for Projects API.
 
 Uses FastAPI's TestClient to test the API endpoints without running a real server.
 """
+import json
+import random
+import sys
+import threading
+import time
+
 import pytest
+from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
 from uuid import uuid4
 
-from app.main import app
-from app.api.v1.projects_router import get_repository
+from app.core.config import Settings
+from app.application.use_cases.get_project_as_of import GetProjectAsOfUseCase
+from app.application.use_cases.update_project import UpdateProjectUseCase
+from app.core.container import Container
+from app.main import create_app
+from app.domain.entities import Project, ProjectStatus, utc_now
+from app.domain.exceptions import ProjectVersionConflictException, WorkspaceQuotaExceededException
 from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+from app.infrastructure.repositories.revision_repository import InMemoryRevisionRepository
+from app.infrastructure.repositories.task_repository import InMemoryTaskRepository
+
+
+@pytest.fixture
+def repository():
+    """Create a fresh in-memory repository for each test."""
+    return InMemoryProjectRepository()
 
 
 @pytest.fixture
-def client():
+def client(repository):
     """Create a test client with a fresh repository for each test."""
-    # Override the repository dependency with a fresh instance
-    test_repo = InMemoryProjectRepository()
-    app.dependency_overrides[get_repository] = lambda: test_repo
+    # Build the app around fresh adapter instances
+    container = Container(
+        Settings(),
+        repository=repository,
+        task_repository=InMemoryTaskRepository(),
+        revision_repository=InMemoryRevisionRepository(),
+    )
     
-    with TestClient(app) as test_client:
+    with TestClient(create_app(container=container)) as test_client:
         yield test_client
-    
-    # Clear overrides after test
-    app.dependency_overrides.clear()
 
 
 def test_health_check(client):
@@ -158,3 +179,372 @@ def test_create_project_with_invalid_data(client):
     
     response = client.post("/api/v1/projects", json=project_data)
     assert response.status_code == 422  # Validation error
+
+
+def test_list_projects_by_created_range(client, repository):
+    """Test filtering projects by a creation time window."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for day in range(5):
+        repository.save(Project(
+            name=f"Project {day}",
+            description=f"Created on day {day}",
+            status=ProjectStatus.PLANNED,
+            created_at=base + timedelta(days=day),
+        ))
+    
+    response = client.get(
+        "/api/v1/projects",
+        params={
+            "created_after": (base + timedelta(days=1)).isoformat(),
+            "created_before": (base + timedelta(days=4)).isoformat(),
+        },
+    )
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()] == ["Project 3", "Project 2", "Project 1"]
+    
+    # Naive timestamps are interpreted as UTC
+    response = client.get("/api/v1/projects", params={"created_after": "2024-01-04T00:00:00"})
+    assert [p["name"] for p in response.json()] == ["Project 4", "Project 3"]
+
+
+def test_list_projects_with_inverted_range(client):
+    """Test that an inverted creation time window is rejected."""
+    response = client.get(
+        "/api/v1/projects",
+        params={
+            "created_after": "2024-02-01T00:00:00Z",
+            "created_before": "2024-01-01T00:00:00Z",
+        },
+    )
+    assert response.status_code == 400
+
+
+def test_batch_get_projects(client):
+    """Test fetching several projects at once, including unknown IDs."""
+    ids = []
+    for i in range(3):
+        response = client.post("/api/v1/projects", json={
+            "name": f"Project {i}",
+            "description": f"Description {i}",
+        })
+        ids.append(response.json()["id"])
+    fake_id = str(uuid4())
+    
+    response = client.post(
+        "/api/v1/projects:batchGet",
+        json={"ids": [ids[2], fake_id, ids[0], ids[2]]},
+    )
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert [p["id"] for p in data["projects"]] == [ids[2], ids[0]]
+    assert data["missing_ids"] == [fake_id]
+
+
+def test_batch_get_projects_requires_ids(client):
+    """Test that an empty batch is rejected."""
+    response = client.post("/api/v1/projects:batchGet", json={"ids": []})
+    assert response.status_code == 422
+
+
+def test_create_app_loads_seed_data(tmp_path, repository):
+    """Test that the app factory preloads seed data during startup."""
+    seed_file = tmp_path / "projects.json"
+    seed_file.write_text(json.dumps([
+        {"name": "Seeded", "description": "Loaded at startup", "status": "DONE"},
+    ]))
+    seeded_settings = Settings(seed_data_path=str(seed_file))
+    seeded_app = create_app(
+        seeded_settings,
+        container=Container(seeded_settings, repository=repository),
+    )
+    
+    with TestClient(seeded_app) as test_client:
+        response = test_client.get("/api/v1/projects")
+    
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()] == ["Seeded"]
+
+
+def test_project_revisions_and_as_of(client):
+    """Test that updates are recorded and past states can be read back."""
+    create_response = client.post("/api/v1/projects", json={
+        "name": "Original Name",
+        "description": "Original description",
+    })
+    project_id = create_response.json()["id"]
+    assert client.get(f"/api/v1/projects/{project_id}/revisions").json() == []
+    
+    client.put(f"/api/v1/projects/{project_id}", json={"name": "Renamed"})
+    client.put(f"/api/v1/projects/{project_id}", json={"name": "Renamed", "status": "DONE"})
+    
+    revisions = client.get(f"/api/v1/projects/{project_id}/revisions").json()
+    assert [r["revision"] for r in revisions] == [0, 1, 2]
+    assert revisions[0]["checkpoint"] is True
+    assert revisions[1]["changes"] == {"name": "Renamed"}
+    assert revisions[2]["changes"] == {"status": "DONE"}  # Unchanged name not recorded
+    
+    response = client.get(f"/api/v1/projects/{project_id}", params={"as_of": revisions[1]["changed_at"]})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert response.json()["status"] == "PLANNED"
+    
+    response = client.get(f"/api/v1/projects/{project_id}", params={"as_of": "2000-01-01T00:00:00Z"})
+    assert response.status_code == 404
+
+
+def test_as_of_keeps_workspace(client):
+    """Test that a past state is reported in the project's own workspace."""
+    project_id = client.post("/api/v1/projects", json={
+        "name": "Tenant project",
+        "description": "Owned by acme",
+        "workspace_id": "acme",
+    }).json()["id"]
+    client.put(f"/api/v1/projects/{project_id}", json={"name": "Renamed"})
+    
+    revisions = client.get(f"/api/v1/projects/{project_id}/revisions").json()
+    response = client.get(f"/api/v1/projects/{project_id}", params={"as_of": revisions[0]["changed_at"]})
+    assert response.json()["name"] == "Tenant project"
+    assert response.json()["workspace_id"] == "acme"
+
+
+def test_updates_never_hide_project_from_readers(repository):
+    """Test that lock-free reads always find a project while it is being saved."""
+    project = repository.save(Project(name="Busy", description="D", status=ProjectStatus.PLANNED))
+    done = threading.Event()
+    misses = []
+    
+    def read():
+        while not done.is_set():
+            if repository.find_by_id(project.id) is None:
+                misses.append(1)
+    
+    # Switch threads often so the reader lands inside writes
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    reader = threading.Thread(target=read)
+    try:
+        reader.start()
+        for _ in range(20000):
+            repository.save(project.copy())
+    finally:
+        done.set()
+        reader.join()
+        sys.setswitchinterval(previous_interval)
+    assert misses == []
+
+
+def test_list_projects_by_workspace(client, repository):
+    """Test that listings can be scoped to one workspace."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i, workspace in enumerate(["acme", "globex", "acme", "globex", "acme"]):
+        repository.save(Project(
+            name=f"{workspace} {i}",
+            description="Workspace project",
+            status=ProjectStatus.PLANNED,
+            created_at=base + timedelta(days=i),
+            workspace_id=workspace,
+        ))
+    
+    response = client.get("/api/v1/projects", params={"workspace_id": "acme"})
+    assert [p["name"] for p in response.json()] == ["acme 4", "acme 2", "acme 0"]
+    assert {p["workspace_id"] for p in response.json()} == {"acme"}
+    
+    # Unscoped listings merge all workspaces newest first
+    response = client.get("/api/v1/projects")
+    assert [p["name"] for p in response.json()] == ["acme 4", "globex 3", "acme 2", "globex 1", "acme 0"]
+    
+    response = client.get("/api/v1/projects", params={"workspace_id": "initech"})
+    assert response.json() == []
+
+
+def test_create_project_in_workspace(client):
+    """Test creating a project in a workspace, defaulting to 'default'."""
+    response = client.post("/api/v1/projects", json={
+        "name": "Tenant project",
+        "description": "Belongs to a tenant",
+        "workspace_id": "acme",
+    })
+    assert response.status_code == 201
+    assert response.json()["workspace_id"] == "acme"
+    
+    response = client.post("/api/v1/projects", json={"name": "Plain", "description": "No workspace"})
+    assert response.json()["workspace_id"] == "default"
+    
+    response = client.post("/api/v1/projects", json={
+        "name": "Bad",
+        "description": "Invalid workspace",
+        "workspace_id": "not a slug!",
+    })
+    assert response.status_code == 422
+
+
+def test_workspace_quota():
+    """Test that a workspace cannot grow past its quota while others can."""
+    quota = InMemoryProjectRepository.PROJECT_OVERHEAD_BYTES * 2 + 100
+    limited_repo = InMemoryProjectRepository(max_workspace_bytes=quota)
+    client = TestClient(create_app(container=Container(Settings(), repository=limited_repo)))
+    
+    payload = {"name": "P", "description": "D", "workspace_id": "small"}
+    assert client.post("/api/v1/projects", json=payload).status_code == 201
+    project_id = client.post("/api/v1/projects", json=payload).json()["id"]
+    assert client.post("/api/v1/projects", json=payload).status_code == 507
+    
+    # Growing a project past the quota is rejected and leaves it unchanged
+    response = client.put(f"/api/v1/projects/{project_id}", json={"description": "x" * 500})
+    assert response.status_code == 507
+    assert client.get(f"/api/v1/projects/{project_id}").json()["description"] == "D"
+    
+    # Other workspaces have their own budget
+    payload["workspace_id"] = "other"
+    assert client.post("/api/v1/projects", json=payload).status_code == 201
+
+
+def test_update_with_if_match(client):
+    """Test ETags on reads and writes, and conditional updates with If-Match."""
+    response = client.post("/api/v1/projects", json={"name": "Versioned", "description": "v1"})
+    project_id = response.json()["id"]
+    assert response.headers["ETag"] == '"1"'
+    assert client.get(f"/api/v1/projects/{project_id}").headers["ETag"] == '"1"'
+    
+    response = client.put(
+        f"/api/v1/projects/{project_id}",
+        json={"description": "v2"},
+        headers={"If-Match": '"1"'},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"2"'
+    
+    # A client still holding version 1 cannot overwrite version 2
+    response = client.put(
+        f"/api/v1/projects/{project_id}",
+        json={"description": "stale"},
+        headers={"If-Match": '"1"'},
+    )
+    assert response.status_code == 412
+    assert client.get(f"/api/v1/projects/{project_id}").json()["description"] == "v2"
+    
+    # Weak or malformed tags never match
+    for tag in ('W/"2"', "2", '"x", "3"'):
+        response = client.put(f"/api/v1/projects/{project_id}", json={"name": "X"}, headers={"If-Match": tag})
+        assert response.status_code == 412
+    
+    # A list matches if any strong tag in it is current
+    response = client.put(
+        f"/api/v1/projects/{project_id}",
+        json={"name": "Listed"},
+        headers={"If-Match": 'W/"1", "2", "3"'},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"3"'
+    
+    # "*" and no header update whatever version is current
+    response = client.put(f"/api/v1/projects/{project_id}", json={"name": "Any"}, headers={"If-Match": "*"})
+    assert response.headers["ETag"] == '"4"'
+    response = client.put(f"/api/v1/projects/{project_id}", json={"name": "Unconditional"})
+    assert response.headers["ETag"] == '"5"'
+    
+    response = client.put(
+        f"/api/v1/projects/{uuid4()}",
+        json={"name": "Missing"},
+        headers={"If-Match": '"1"'},
+    )
+    assert response.status_code == 404
+
+
+def test_save_if_version_is_atomic(repository):
+    """Test that concurrent compare-and-swap increments never lose a write."""
+    project = repository.save(Project(name="Counter", description="0", status=ProjectStatus.PLANNED))
+    threads, increments = 8, 200
+    
+    def increment():
+        for _ in range(increments):
+            while True:
+                current = repository.find_by_id(project.id)
+                updated = current.copy()
+                updated.update(description=str(int(current.description) + 1))
+                try:
+                    repository.save_if_version(updated, current.version)
+                    break
+                except ProjectVersionConflictException:
+                    continue
+    
+    workers = [threading.Thread(target=increment) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    
+    stored = repository.find_by_id(project.id)
+    assert stored.description == str(threads * increments)
+    assert stored.version == 1 + threads * increments
+    
+    with pytest.raises(ProjectVersionConflictException):
+        repository.save_if_version(stored.copy(), 1)
+
+
+def test_concurrent_updates_keep_history_in_version_order(repository):
+    """Test that revisions recorded in any order still match the stored project."""
+    
+    class SlowRevisionRepository(InMemoryRevisionRepository):
+        def record_change(self, *args, **kwargs):
+            # Widen the window between the save and the revision write
+            time.sleep(random.random() / 1000)
+            return super().record_change(*args, **kwargs)
+    
+    revision_repository = SlowRevisionRepository(checkpoint_interval=4)
+    update = UpdateProjectUseCase(repository, revision_repository)
+    project = repository.save(Project(name="Start", description="D", status=ProjectStatus.PLANNED))
+    
+    def edit(thread):
+        for i in range(20):
+            update.execute(project.id, name=f"Thread {thread} edit {i}")
+    
+    workers = [threading.Thread(target=edit, args=(thread,)) for thread in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    
+    stored = repository.find_by_id(project.id)
+    assert [r.version for r in revision_repository.find_by_project(project.id)] == list(range(1, 82))
+    current = GetProjectAsOfUseCase(repository, revision_repository).execute(project.id, utc_now())
+    assert current.name == stored.name
+
+
+def test_update_retries_on_conflicts(client, repository, monkeypatch):
+    """Test that conflicts only fail conditional updates, after bounded retries."""
+    project_id = client.post("/api/v1/projects", json={"name": "Hot", "description": "D"}).json()["id"]
+    save_if_version = repository.save_if_version
+    conflicts = []
+    
+    def contended(updated, expected_version):
+        # Another writer wins the first few races, without changing the version
+        if len(conflicts) < UpdateProjectUseCase.MAX_ATTEMPTS + 5:
+            conflicts.append(expected_version)
+            raise ProjectVersionConflictException(str(updated.id), [expected_version], expected_version)
+        return save_if_version(updated, expected_version)
+    
+    monkeypatch.setattr(repository, "save_if_version", contended)
+    
+    # A conditional update gives up with 412 once its retries run out
+    response = client.put(f"/api/v1/projects/{project_id}", json={"name": "Never"}, headers={"If-Match": '"1"'})
+    assert response.status_code == 412
+    assert len(conflicts) == UpdateProjectUseCase.MAX_ATTEMPTS
+    
+    # An unconditional update keeps retrying until it lands
+    response = client.put(f"/api/v1/projects/{project_id}", json={"name": "Eventually"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Eventually"
+    assert len(conflicts) == UpdateProjectUseCase.MAX_ATTEMPTS + 5
+
+
+def test_rejected_writes_leave_no_workspace_behind():
+    """Test that quota-rejected writes to new workspaces keep no partition."""
+    repository = InMemoryProjectRepository(max_workspace_bytes=100)
+    for workspace in ("t0", "t1", "t2"):
+        with pytest.raises(WorkspaceQuotaExceededException):
+            repository.save(Project(name="P", description="D", status=ProjectStatus.PLANNED, workspace_id=workspace))
+    
+    assert repository._partitions == {}
+    assert repository.find_all() == []
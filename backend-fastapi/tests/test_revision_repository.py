@@ -0,0 +1,94 @@
+"""
+Tests for the delta-encoded revision history repository.
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities import ProjectStatus
+from app.infrastructure.repositories.revision_repository import InMemoryRevisionRepository
+
+
+CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_point_in_time_reads_across_checkpoints():
+    """Test rebuilding every past state with a small checkpoint interval."""
+    repository = InMemoryRevisionRepository(checkpoint_interval=4)
+    project_id = uuid4()
+    state = {"name": "Project", "description": "Description", "status": ProjectStatus.PLANNED}
+    expected = [dict(state)]
+    
+    for i in range(1, 11):
+        changes = {"name": f"Project v{i}"}
+        if i % 3 == 0:
+            changes["status"] = ProjectStatus.IN_PROGRESS
+        revision = repository.record_change(
+            project_id,
+            previous_state=state,
+            changes=changes,
+            changed_at=CREATED_AT + timedelta(hours=i),
+            created_at=CREATED_AT,
+            version=i + 1,
+        )
+        state = {**state, **changes}
+        expected.append(dict(state))
+        assert revision.number == i
+        assert revision.is_checkpoint == (i % 4 == 0)
+    
+    for i, expected_state in enumerate(expected):
+        as_of = CREATED_AT + timedelta(hours=i, minutes=30)
+        assert repository.find_state_as_of(project_id, as_of) == expected_state
+    
+    assert repository.find_state_as_of(project_id, CREATED_AT - timedelta(seconds=1)) is None
+    assert [r.number for r in repository.find_by_project(project_id)] == list(range(11))
+
+
+def test_delete_by_project_forgets_history():
+    """Test that a project's history can be dropped."""
+    repository = InMemoryRevisionRepository()
+    project_id = uuid4()
+    repository.record_change(
+        project_id,
+        previous_state={"name": "A", "description": "B", "status": ProjectStatus.PLANNED},
+        changes={"name": "C"},
+        changed_at=CREATED_AT + timedelta(hours=1),
+        created_at=CREATED_AT,
+        version=2,
+    )
+    
+    repository.delete_by_project(project_id)
+    assert repository.find_by_project(project_id) == []
+    assert repository.find_state_as_of(project_id, CREATED_AT + timedelta(days=1)) is None
+
+
+def test_late_changes_are_placed_by_version():
+    """Test that changes recorded out of order end up in version order."""
+    repository = InMemoryRevisionRepository(checkpoint_interval=2)
+    project_id = uuid4()
+    states = [{"name": f"v{v}", "description": "D", "status": ProjectStatus.PLANNED} for v in range(1, 6)]
+    
+    def record(version):
+        repository.record_change(
+            project_id,
+            previous_state=states[version - 2],
+            changes={"name": f"v{version}"},
+            changed_at=CREATED_AT + timedelta(hours=version),
+            created_at=CREATED_AT,
+            version=version,
+        )
+    
+    for version in (3, 2, 5, 4):
+        record(version)
+    
+    revisions = repository.find_by_project(project_id)
+    assert [r.version for r in revisions] == [1, 2, 3, 4, 5]
+    assert [r.changes for r in revisions[1:]] == [{"name": f"v{v}"} for v in range(2, 6)]
+    assert [r.is_checkpoint for r in revisions] == [True, False, True, False, True]
+    for version, state in enumerate(states, start=1):
+        as_of = CREATED_AT + timedelta(hours=version, minutes=30)
+        assert repository.find_state_as_of(project_id, as_of) == state
+    
+    with pytest.raises(ValueError):
+        record(4)
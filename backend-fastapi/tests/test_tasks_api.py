@@ -0,0 +1,131 @@
+"""
+Tests for the project Tasks API and task rollups.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from uuid import uuid4
+
+from app.core.config import Settings
+from app.core.container import Container
+from app.main import create_app
+from app.infrastructure.repositories.project_repository import InMemoryProjectRepository
+from app.infrastructure.repositories.task_repository import InMemoryTaskRepository
+
+
+@pytest.fixture
+def task_repository():
+    """Create a fresh in-memory task repository for each test."""
+    return InMemoryTaskRepository()
+
+
+@pytest.fixture
+def client(task_repository):
+    """Create a test client with fresh project and task repositories."""
+    container = Container(
+        Settings(),
+        repository=InMemoryProjectRepository(),
+        task_repository=task_repository,
+    )
+    
+    with TestClient(create_app(container=container)) as test_client:
+        yield test_client
+
+
+def create_project(client, name="Project"):
+    response = client.post("/api/v1/projects", json={"name": name, "description": f"{name} description"})
+    return response.json()["id"]
+
+
+def test_task_lifecycle(client):
+    """Test creating, listing, updating and deleting tasks."""
+    project_id = create_project(client)
+    
+    response = client.post(f"/api/v1/projects/{project_id}/tasks", json={"title": "Write spec"})
+    assert response.status_code == 201
+    task = response.json()
+    assert task["status"] == "TODO"
+    assert task["project_id"] == project_id
+    
+    client.post(f"/api/v1/projects/{project_id}/tasks", json={"title": "Review spec"})
+    response = client.get(f"/api/v1/projects/{project_id}/tasks")
+    assert [t["title"] for t in response.json()] == ["Write spec", "Review spec"]
+    
+    response = client.put(f"/api/v1/projects/{project_id}/tasks/{task['id']}", json={"status": "DONE"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "DONE"
+    
+    response = client.delete(f"/api/v1/projects/{project_id}/tasks/{task['id']}")
+    assert response.status_code == 204
+    assert len(client.get(f"/api/v1/projects/{project_id}/tasks").json()) == 1
+
+
+def test_tasks_of_unknown_project(client):
+    """Test that task endpoints report missing projects and foreign tasks."""
+    response = client.get(f"/api/v1/projects/{uuid4()}/tasks")
+    assert response.status_code == 404
+    response = client.post(f"/api/v1/projects/{uuid4()}/tasks", json={"title": "Orphan"})
+    assert response.status_code == 404
+    
+    # A task is not reachable through another project's URL
+    project_a = create_project(client, "A")
+    project_b = create_project(client, "B")
+    task_id = client.post(f"/api/v1/projects/{project_a}/tasks", json={"title": "Task"}).json()["id"]
+    response = client.put(f"/api/v1/projects/{project_b}/tasks/{task_id}", json={"status": "DONE"})
+    assert response.status_code == 404
+
+
+def test_list_projects_with_task_rollup(client, task_repository, monkeypatch):
+    """Test that rollups are kept up to date and loaded in one batched call."""
+    project_a = create_project(client, "A")
+    project_b = create_project(client, "B")
+    for i in range(4):
+        client.post(f"/api/v1/projects/{project_a}/tasks", json={
+            "title": f"Task {i}",
+            "status": "DONE" if i == 0 else "TODO",
+        })
+    task_id = client.get(f"/api/v1/projects/{project_a}/tasks").json()[1]["id"]
+    client.put(f"/api/v1/projects/{project_a}/tasks/{task_id}", json={"status": "DONE"})
+    
+    calls = []
+    original = task_repository.get_rollups
+    monkeypatch.setattr(task_repository, "get_rollups", lambda ids: calls.append(ids) or original(ids))
+    
+    response = client.get("/api/v1/projects", params={"include_task_rollup": True})
+    assert response.status_code == 200
+    rollups = {p["id"]: p["task_rollup"] for p in response.json()}
+    assert rollups[project_a] == {"total": 4, "done": 2, "percent_complete": 50.0}
+    assert rollups[project_b] == {"total": 0, "done": 0, "percent_complete": 0.0}
+    assert len(calls) == 1
+    
+    # Rollups are omitted unless requested
+    assert "task_rollup" not in client.get("/api/v1/projects").json()[0]
+    assert "task_rollup" not in client.get(f"/api/v1/projects/{project_a}").json()
+    response = client.post("/api/v1/projects:batchGet", json={"ids": [project_a]})
+    assert "task_rollup" not in response.json()["projects"][0]
+
+
+def test_create_task_racing_project_delete(client, task_repository, monkeypatch):
+    """Test that a task saved after its project was deleted is rolled back."""
+    project_id = create_project(client)
+    save = task_repository.save
+    
+    def delete_project_then_save(task):
+        # The project is deleted between the existence check and the save
+        client.app.state.container.delete_project.execute(task.project_id)
+        return save(task)
+    
+    monkeypatch.setattr(task_repository, "save", delete_project_then_save)
+    response = client.post(f"/api/v1/projects/{project_id}/tasks", json={"title": "Orphan"})
+    assert response.status_code == 404
+    
+    assert task_repository.find_by_project(project_id) == []
+    assert project_id not in {str(key) for key in task_repository._rollups}
+
+
+def test_delete_project_removes_tasks(client, task_repository):
+    """Test that deleting a project also deletes its tasks."""
+    project_id = create_project(client)
+    client.post(f"/api/v1/projects/{project_id}/tasks", json={"title": "Task"})
+    
+    client.delete(f"/api/v1/projects/{project_id}")
+    assert task_repository.get_rollups([project_id])[project_id].total == 0
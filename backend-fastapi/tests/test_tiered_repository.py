@@ -0,0 +1,194 @@
+"""
+Tests for the tiered (hot/cold) project repository.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.domain.entities import Project, ProjectStatus
+from app.domain.exceptions import ProjectNotFoundException, ProjectVersionConflictException
+from app.infrastructure.repositories.tiered_project_repository import TieredProjectRepository
+
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create a tiered repository with a 30-day cold threshold."""
+    repository = TieredProjectRepository(
+        segment_dir=str(tmp_path),
+        cold_after=timedelta(days=30),
+    )
+    yield repository
+    repository.close()
+
+
+def make_project(name, status, age_days):
+    return Project(
+        name=name,
+        description=f"{name} description " * 20,
+        status=status,
+        created_at=NOW - timedelta(days=age_days),
+    )
+
+
+def test_demotes_only_old_done_projects(repository):
+    """Test that only DONE projects past the threshold move to cold storage."""
+    old_done = repository.save(make_project("Old done", ProjectStatus.DONE, 90))
+    recent_done = repository.save(make_project("Recent done", ProjectStatus.DONE, 5))
+    old_active = repository.save(make_project("Old active", ProjectStatus.IN_PROGRESS, 60))
+    
+    assert repository.demote_cold_projects(now=NOW) == 1
+    assert repository.cold_count == 1
+    assert repository.hot_count == 2
+    
+    loaded = repository.find_by_id(old_done.id)
+    assert loaded.name == old_done.name
+    assert loaded.description == old_done.description
+    assert loaded.created_at == old_done.created_at
+    assert repository.exists(old_done.id)
+    
+    assert [p.name for p in repository.find_all()] == ["Recent done", "Old active", "Old done"]
+    assert set(repository.find_by_ids([old_done.id, recent_done.id, old_active.id])) == {
+        old_done.id, recent_done.id, old_active.id,
+    }
+
+
+def test_range_query_spans_tiers(repository):
+    """Test that created_at range queries include cold projects in order."""
+    for age in (100, 80, 60, 40, 20):
+        repository.save(make_project(f"Done {age}", ProjectStatus.DONE, age))
+    repository.demote_cold_projects(now=NOW)
+    
+    projects = repository.find_all(
+        created_after=NOW - timedelta(days=80),
+        created_before=NOW - timedelta(days=20),
+    )
+    assert [p.name for p in projects] == ["Done 40", "Done 60", "Done 80"]
+
+
+def test_saving_cold_project_promotes_it(repository):
+    """Test that updating a cold project moves it back to the hot tier."""
+    project = repository.save(make_project("Archived", ProjectStatus.DONE, 90))
+    repository.demote_cold_projects(now=NOW)
+    
+    cold_copy = repository.find_by_id(project.id)
+    cold_copy.update(status=ProjectStatus.IN_PROGRESS)
+    repository.save(cold_copy)
+    
+    assert repository.cold_count == 0
+    assert repository.find_by_id(project.id).status == ProjectStatus.IN_PROGRESS
+    assert len(repository.find_all()) == 1
+
+
+def test_delete_cold_project(repository):
+    """Test deleting a project that lives in the cold tier."""
+    project = repository.save(make_project("Archived", ProjectStatus.DONE, 90))
+    repository.demote_cold_projects(now=NOW)
+    
+    repository.delete(project.id)
+    assert not repository.exists(project.id)
+    assert repository.find_all() == []
+    with pytest.raises(ProjectNotFoundException):
+        repository.delete(project.id)
+
+
+def test_conditional_save_of_cold_project(repository):
+    """Test that versions survive the cold tier and guard writes to it."""
+    project = repository.save(make_project("Archived", ProjectStatus.DONE, 90))
+    repository.save_if_version(project.copy(), 1)
+    repository.demote_cold_projects(now=NOW)
+    
+    cold_copy = repository.find_by_id(project.id)
+    assert cold_copy.version == 2
+    with pytest.raises(ProjectVersionConflictException):
+        repository.save_if_version(cold_copy.copy(), 1)
+    assert repository.cold_count == 1
+    
+    repository.save_if_version(cold_copy, 2)
+    assert repository.cold_count == 0
+    assert repository.find_by_id(project.id).version == 3
+
+
+def test_each_repository_owns_its_segment(tmp_path):
+    """Test that repositories sharing a directory never share a segment file."""
+    first = TieredProjectRepository(segment_dir=str(tmp_path))
+    project = first.save(make_project("Archived", ProjectStatus.DONE, 90))
+    first.demote_cold_projects(now=NOW)
+    
+    # A second process starting up must not truncate the first one's segment
+    second = TieredProjectRepository(segment_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 2
+    assert first.find_by_id(project.id).name == "Archived"
+    
+    first.close()
+    second.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_unknown_repository_backend_is_rejected():
+    """Test that a misspelled backend fails instead of falling back to memory."""
+    with pytest.raises(ValidationError):
+        Settings(repository_backend="teired")
+
+
+def test_promotion_never_hides_project_from_readers(repository, monkeypatch):
+    """Test that a promoted project is in the hot tier before leaving the cold one."""
+    project = repository.save(make_project("Archived", ProjectStatus.DONE, 90))
+    repository.demote_cold_projects(now=NOW)
+    
+    # Look the project up the way a concurrent, lock-free reader would, right
+    # as the cold copy is dropped
+    seen = []
+    remove = repository._cold.remove
+    
+    def remove_and_read(project_id):
+        removed = remove(project_id)
+        seen.append(repository.find_by_id(project_id))
+        return removed
+    
+    monkeypatch.setattr(repository._cold, "remove", remove_and_read)
+    repository.save(repository.find_by_id(project.id))
+    
+    assert repository.cold_count == 0
+    assert [p.name for p in seen] == ["Archived"]
+
+
+def test_sweep_runs_in_background_after_writes(tmp_path):
+    """Test that every ``sweep_every`` writes start a demotion sweep off the caller's thread."""
+    repository = TieredProjectRepository(segment_dir=str(tmp_path), sweep_every=2)
+    try:
+        old_done = repository.save(make_project("Old done", ProjectStatus.DONE, 90))
+        repository.save(make_project("Active", ProjectStatus.IN_PROGRESS, 90))
+        
+        repository._sweeper.join(timeout=5)
+        assert repository.cold_count == 1
+        assert repository.find_by_id(old_done.id).name == "Old done"
+    finally:
+        repository.close()
+
+
+def test_sweep_skips_projects_saved_while_encoding(repository, monkeypatch):
+    """Test that a candidate updated during compression stays in the hot tier."""
+    updated = repository.save(make_project("Updated", ProjectStatus.DONE, 90))
+    untouched = repository.save(make_project("Untouched", ProjectStatus.DONE, 90))
+    encode = repository._cold.encode
+    
+    def save_and_encode(projects):
+        projects = list(projects)
+        copy = repository.find_by_id(updated.id).copy()
+        copy.update(description="Edited mid-sweep")
+        repository.save_if_version(copy, copy.version)
+        return encode(projects)
+    
+    monkeypatch.setattr(repository._cold, "encode", save_and_encode)
+    
+    assert repository.demote_cold_projects(now=NOW) == 1
+    assert untouched.id in repository._cold
+    assert updated.id not in repository._cold
+    assert repository.find_by_id(updated.id).description == "Edited mid-sweep"
+    assert repository.hot_count == 1